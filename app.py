@@ -12,8 +12,15 @@ __version__ = "2.6.0"
 from gui.education_savings_app import main
 import streamlit as st
 
+
+@st.cache_resource
+def _clear_stale_caches(version: str) -> None:
+    """Clear cached data once per server and app version, not on every rerun."""
+    st.cache_data.clear()
+
+
 # Clear cache to ensure updated calculations are used
-st.cache_data.clear()
+_clear_stale_caches(__version__)
 
 if __name__ == "__main__":
     main()
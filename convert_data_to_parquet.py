@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Convert the calculator's source CSVs to Parquet.
+
+Run once at build/deploy time. EducationDataProcessor reads the .parquet
+copy when it is at least as new as its CSV and falls back to the CSV otherwise.
+"""
+
+from pathlib import Path
+
+from gui.data_processor import DATA_FILES, read_csv_table
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+def convert_csvs_to_parquet():
+    """Write a zstd-compressed Parquet file next to each source CSV."""
+    for name, (csv_file, parse_dates) in DATA_FILES.items():
+        csv_path = DATA_DIR / csv_file
+        parquet_path = csv_path.with_suffix('.parquet')
+
+        df = read_csv_table(csv_path, parse_dates)
+        df.to_parquet(parquet_path, compression='zstd', index=False)
+
+        print(f"{name}: {len(df)} rows, {csv_path.stat().st_size / 1024:.1f} KB CSV -> "
+              f"{parquet_path.stat().st_size / 1024:.1f} KB Parquet ({parquet_path.relative_to(DATA_DIR)})")
+
+
+if __name__ == "__main__":
+    convert_csvs_to_parquet()
+    print("\n✅ Parquet data files written")
@@ -3,11 +3,47 @@ Mobile-Optimized Chart Rendering
 Provides touch-friendly charts optimized for mobile and tablet viewing.
 """
 
-import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import pandas as pd
-from typing import Dict, List, Any
+import numpy as np
+from typing import Dict, List, Any, Union
+from gui.fee_calculator import ScenarioBatch
+from gui.core.chart_utils import split_historical_projected
+
+
+def format_inr_array(amounts: np.ndarray) -> List[str]:
+    """Compact INR bar labels (lakhs above ₹1L) for an array of amounts.
+
+    Divisor and unit are picked for the whole array with np.select; only the
+    final string assembly runs per element.
+    """
+    amounts = np.asarray(amounts, dtype=float)
+    in_lakhs = amounts >= 100000
+    values = amounts / np.select([in_lakhs], [100000.0], default=1.0)
+    return [f"₹{v:.1f}L" if lakh else f"₹{v:,.0f}" for v, lakh in zip(values, in_lakhs)]
+
+
+# Per-device trace and layout styling for the projection charts, looked up once per renderer
+_COMPACT_LEGEND = dict(orientation="h", yanchor="bottom", y=-0.3, xanchor="center", x=0.5)
+_SIDE_LEGEND = dict(orientation="v", yanchor="top", y=1, xanchor="left", x=1.02)
+_PROJECTION_STYLES = {
+    'mobile': dict(line_width=2, marker_size=6),
+    'tablet': dict(line_width=3, marker_size=8),
+    'desktop': dict(line_width=3, marker_size=8),
+}
+_PROJECTION_LAYOUTS = {
+    'mobile': dict(
+        title_font_size=14, xaxis_tickangle=45, xaxis_tickfont_size=8, yaxis_tickfont_size=8,
+        height=250, margin=dict(l=20, r=20, t=60, b=40), font_size=10, legend=_COMPACT_LEGEND
+    ),
+    'tablet': dict(
+        title_font_size=16, xaxis_tickangle=0, xaxis_tickfont_size=10, yaxis_tickfont_size=10,
+        height=300, margin=dict(l=40, r=40, t=80, b=50), font_size=12, legend=_SIDE_LEGEND
+    ),
+    'desktop': dict(
+        title_font_size=16, xaxis_tickangle=0, xaxis_tickfont_size=10, yaxis_tickfont_size=10,
+        height=400, margin=dict(l=40, r=40, t=80, b=50), font_size=12, legend=_SIDE_LEGEND
+    ),
+}
 
 
 class MobileChartRenderer:
@@ -18,47 +54,43 @@ class MobileChartRenderer:
         self.device_type = device_type
         self.is_mobile = device_type == 'mobile'
         self.is_tablet = device_type == 'tablet'
+        device = device_type if device_type in _PROJECTION_LAYOUTS else 'desktop'
+        self._trace_style = _PROJECTION_STYLES[device]
+        self._projection_layout = _PROJECTION_LAYOUTS[device]
 
     def create_mobile_fee_projection_chart(self, projections_data: Dict) -> go.Figure:
         """Create mobile-optimized fee projection chart."""
         course_info = projections_data['course_info']
-        fee_projections = projections_data['fee_projections']
-
-        # Prepare data
-        years = list(fee_projections.keys())
-        fees = list(fee_projections.values())
 
         # Historical vs projected
-        historical_years = [y for y in years if y <= 2025]
-        projected_years = [y for y in years if y > 2025]
+        historical_years, historical_fees, connect_years, connect_fees = split_historical_projected(
+            projections_data['fee_years'], projections_data['fees']
+        )
 
         fig = go.Figure()
 
         # Historical data
-        if historical_years:
-            historical_fees = [fee_projections[y] for y in historical_years]
+        if historical_years.size:
             fig.add_trace(go.Scatter(
                 x=historical_years,
                 y=historical_fees,
                 mode='lines+markers',
                 name='Historical',
-                line=dict(color='#1f77b4', width=2 if self.is_mobile else 3),
-                marker=dict(size=6 if self.is_mobile else 8),
+                line_color='#1f77b4',
+                **self._trace_style,
                 hovertemplate='<b>%{x}</b><br>Fee: £%{y:,.0f}<extra></extra>'
             ))
 
         # Projected data
-        if projected_years:
-            connect_years = [historical_years[-1]] + projected_years if historical_years else projected_years
-            connect_fees = [fee_projections[y] for y in connect_years]
-
+        if connect_years.size:
             fig.add_trace(go.Scatter(
                 x=connect_years,
                 y=connect_fees,
                 mode='lines+markers',
                 name='Projected',
-                line=dict(color='#ff7f0e', width=2 if self.is_mobile else 3, dash='dash'),
-                marker=dict(size=6 if self.is_mobile else 8),
+                line_color='#ff7f0e',
+                line_dash='dash',
+                **self._trace_style,
                 hovertemplate='<b>%{x}</b><br>Fee: £%{y:,.0f}<extra></extra>'
             ))
 
@@ -73,40 +105,14 @@ class MobileChartRenderer:
             subtitle = None
 
         fig.update_layout(
-            title=dict(
-                text=title_text,
-                font=dict(size=14 if self.is_mobile else 16),
-                x=0.5,
-                xanchor='center'
-            ),
+            title_text=title_text,
+            title_x=0.5,
+            title_xanchor='center',
             xaxis_title="Year",
             yaxis_title="Annual Fee (GBP)",
-            height=250 if self.is_mobile else (300 if self.is_tablet else 400),
-            margin=dict(
-                l=20 if self.is_mobile else 40,
-                r=20 if self.is_mobile else 40,
-                t=60 if self.is_mobile else 80,
-                b=40 if self.is_mobile else 50
-            ),
+            yaxis_tickformat='£,.0f',
             hovermode='x unified',
-            font=dict(size=10 if self.is_mobile else 12),
-            legend=dict(
-                orientation="h" if self.is_mobile else "v",
-                yanchor="bottom" if self.is_mobile else "top",
-                y=-0.3 if self.is_mobile else 1,
-                xanchor="center" if self.is_mobile else "left",
-                x=0.5 if self.is_mobile else 1.02
-            )
-        )
-
-        # Mobile-friendly axis formatting
-        fig.update_xaxes(
-            tickangle=45 if self.is_mobile else 0,
-            tickfont=dict(size=8 if self.is_mobile else 10)
-        )
-        fig.update_yaxes(
-            tickformat='£,.0f',
-            tickfont=dict(size=8 if self.is_mobile else 10)
+            **self._projection_layout
         )
 
         if subtitle and self.is_mobile:
@@ -123,42 +129,36 @@ class MobileChartRenderer:
 
     def create_mobile_fx_projection_chart(self, projections_data: Dict) -> go.Figure:
         """Create mobile-optimized exchange rate chart."""
-        fx_projections = projections_data['fx_projections']
-
-        years = list(fx_projections.keys())
-        rates = list(fx_projections.values())
 
         # Historical vs projected
-        historical_years = [y for y in years if y <= 2025]
-        projected_years = [y for y in years if y > 2025]
+        historical_years, historical_rates, connect_years, connect_rates = split_historical_projected(
+            projections_data['fx_years'], projections_data['fx_rates']
+        )
 
         fig = go.Figure()
 
         # Historical data
-        if historical_years:
-            historical_rates = [fx_projections[y] for y in historical_years]
+        if historical_years.size:
             fig.add_trace(go.Scatter(
                 x=historical_years,
                 y=historical_rates,
                 mode='lines+markers',
                 name='Historical',
-                line=dict(color='#2ca02c', width=2 if self.is_mobile else 3),
-                marker=dict(size=6 if self.is_mobile else 8),
+                line_color='#2ca02c',
+                **self._trace_style,
                 hovertemplate='<b>%{x}</b><br>Rate: ₹%{y:.2f}<extra></extra>'
             ))
 
         # Projected data
-        if projected_years:
-            connect_years = [historical_years[-1]] + projected_years if historical_years else projected_years
-            connect_rates = [fx_projections[y] for y in connect_years]
-
+        if connect_years.size:
             fig.add_trace(go.Scatter(
                 x=connect_years,
                 y=connect_rates,
                 mode='lines+markers',
                 name='Projected',
-                line=dict(color='#d62728', width=2 if self.is_mobile else 3, dash='dash'),
-                marker=dict(size=6 if self.is_mobile else 8),
+                line_color='#d62728',
+                line_dash='dash',
+                **self._trace_style,
                 hovertemplate='<b>%{x}</b><br>Rate: ₹%{y:.2f}<extra></extra>'
             ))
 
@@ -172,40 +172,14 @@ class MobileChartRenderer:
             subtitle = None
 
         fig.update_layout(
-            title=dict(
-                text=title_text,
-                font=dict(size=14 if self.is_mobile else 16),
-                x=0.5,
-                xanchor='center'
-            ),
+            title_text=title_text,
+            title_x=0.5,
+            title_xanchor='center',
             xaxis_title="Year",
             yaxis_title="INR per GBP",
-            height=250 if self.is_mobile else (300 if self.is_tablet else 400),
-            margin=dict(
-                l=20 if self.is_mobile else 40,
-                r=20 if self.is_mobile else 40,
-                t=60 if self.is_mobile else 80,
-                b=40 if self.is_mobile else 50
-            ),
+            yaxis_tickformat='₹,.0f',
             hovermode='x unified',
-            font=dict(size=10 if self.is_mobile else 12),
-            legend=dict(
-                orientation="h" if self.is_mobile else "v",
-                yanchor="bottom" if self.is_mobile else "top",
-                y=-0.3 if self.is_mobile else 1,
-                xanchor="center" if self.is_mobile else "left",
-                x=0.5 if self.is_mobile else 1.02
-            )
-        )
-
-        # Mobile-friendly axis formatting
-        fig.update_xaxes(
-            tickangle=45 if self.is_mobile else 0,
-            tickfont=dict(size=8 if self.is_mobile else 10)
-        )
-        fig.update_yaxes(
-            tickformat='₹,.0f',
-            tickfont=dict(size=8 if self.is_mobile else 10)
+            **self._projection_layout
         )
 
         if subtitle and self.is_mobile:
@@ -220,16 +194,17 @@ class MobileChartRenderer:
 
         return fig
 
-    def create_mobile_savings_comparison_chart(self, scenarios: List) -> go.Figure:
-        """Create mobile-optimized savings comparison chart."""
+    def create_mobile_savings_comparison_chart(self, scenarios: Union[ScenarioBatch, List]) -> go.Figure:
+        """Create mobile-optimized savings comparison chart from a ScenarioBatch or scenario list."""
         if not scenarios:
             return None
 
-        # Prepare data
-        strategy_names = [s.strategy_name for s in scenarios]
-        costs_inr = [s.total_cost_inr for s in scenarios]
-        savings_inr = [s.savings_vs_payg_inr for s in scenarios]
-        savings_pct = [s.savings_percentage for s in scenarios]
+        # Columnar view of the scenarios
+        batch = scenarios if isinstance(scenarios, ScenarioBatch) else ScenarioBatch.from_scenarios(scenarios)
+        strategy_names = batch.names
+        costs_inr = batch.cost_inr
+        savings_inr = batch.savings_inr
+        savings_pct = batch.savings_pct
 
         # Shorten strategy names for mobile
         if self.is_mobile:
@@ -249,8 +224,10 @@ class MobileChartRenderer:
         else:
             display_names = strategy_names
 
-        # Create colors
-        colors = ['#2ca02c' if s > 0 else '#d62728' for s in savings_inr]
+        # Create colors and bar labels
+        colors = np.where(savings_inr > 0, '#2ca02c', '#d62728').tolist()
+        savings_text = [f"{label}<br>({p:.1f}%)"
+                        for label, p in zip(format_inr_array(savings_inr), savings_pct)]
 
         if self.is_mobile:
             # Single chart for mobile - focus on savings
@@ -261,8 +238,7 @@ class MobileChartRenderer:
                 y=savings_inr,
                 name='Savings vs Pay-As-You-Go',
                 marker_color=colors,
-                text=[f"₹{s/100000:.1f}L<br>({p:.1f}%)" if s >= 100000 else f"₹{s:,.0f}<br>({p:.1f}%)"
-                      for s, p in zip(savings_inr, savings_pct)],
+                text=savings_text,
                 textposition='auto',
                 hovertemplate='<b>%{x}</b><br>Savings: ₹%{y:,.0f}<extra></extra>'
             ))
@@ -274,76 +250,56 @@ class MobileChartRenderer:
                     x=0.5,
                     xanchor='center'
                 ),
-                xaxis_title="Strategy",
-                yaxis_title="Savings (INR)",
+                xaxis=dict(title="Strategy", tickangle=45, tickfont=dict(size=8)),
+                yaxis=dict(title="Savings (INR)", tickformat='₹,.0f', tickfont=dict(size=8)),
                 height=300,
                 margin=dict(l=20, r=20, t=50, b=60),
                 showlegend=False,
                 font=dict(size=10)
             )
 
-            fig.update_xaxes(
-                tickangle=45,
-                tickfont=dict(size=8)
-            )
-            fig.update_yaxes(
-                tickformat='₹,.0f',
-                tickfont=dict(size=8)
-            )
-
         else:
-            # Two-chart layout for tablet/desktop
-            fig = make_subplots(
-                rows=2, cols=1,
-                subplot_titles=('Total Cost (INR)', 'Savings vs Pay-As-You-Go'),
-                vertical_spacing=0.15
-            )
+            # Cost and savings side by side on one shared x-axis for tablet/desktop
+            fig = go.Figure()
 
             # Cost comparison
-            fig.add_trace(
-                go.Bar(
-                    x=display_names,
-                    y=costs_inr,
-                    name='Total Cost',
-                    marker_color='#1f77b4',
-                    text=[f"₹{c/100000:.1f}L" if c >= 100000 else f"₹{c:,.0f}" for c in costs_inr],
-                    textposition='auto',
-                    hovertemplate='<b>%{x}</b><br>Cost: ₹%{y:,.0f}<extra></extra>'
-                ),
-                row=1, col=1
-            )
+            fig.add_trace(go.Bar(
+                x=display_names,
+                y=costs_inr,
+                name='Total Cost',
+                offsetgroup='cost',
+                marker_color='#1f77b4',
+                text=format_inr_array(costs_inr),
+                textposition='auto',
+                hovertemplate='<b>%{x}</b><br>Cost: ₹%{y:,.0f}<extra></extra>'
+            ))
 
             # Savings comparison
-            fig.add_trace(
-                go.Bar(
-                    x=display_names,
-                    y=savings_inr,
-                    name='Savings',
-                    marker_color=colors,
-                    text=[f"₹{s/100000:.1f}L<br>({p:.1f}%)" if s >= 100000 else f"₹{s:,.0f}<br>({p:.1f}%)"
-                          for s, p in zip(savings_inr, savings_pct)],
-                    textposition='auto',
-                    hovertemplate='<b>%{x}</b><br>Savings: ₹%{y:,.0f}<extra></extra>'
-                ),
-                row=2, col=1
-            )
+            fig.add_trace(go.Bar(
+                x=display_names,
+                y=savings_inr,
+                name='Savings',
+                offsetgroup='savings',
+                marker_color=colors,
+                text=savings_text,
+                textposition='auto',
+                hovertemplate='<b>%{x}</b><br>Savings: ₹%{y:,.0f}<extra></extra>'
+            ))
 
             height = 300 if self.is_tablet else 600
             fig.update_layout(
+                barmode='group',
                 height=height,
-                showlegend=False,
+                # The subplot titles that labelled each series are gone, so name them in a legend
+                showlegend=True,
+                legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1),
                 title_text="Savings Strategy Comparison",
-                font=dict(size=10 if self.is_tablet else 12)
-            )
-
-            # Update y-axis formats
-            fig.update_yaxes(tickformat='₹,.0f', row=1, col=1)
-            fig.update_yaxes(tickformat='₹,.0f', row=2, col=1)
-
-            # Update x-axis
-            fig.update_xaxes(
-                tickangle=45 if self.is_tablet else 0,
-                tickfont=dict(size=8 if self.is_tablet else 10)
+                font=dict(size=10 if self.is_tablet else 12),
+                xaxis=dict(
+                    tickangle=45 if self.is_tablet else 0,
+                    tickfont=dict(size=8 if self.is_tablet else 10)
+                ),
+                yaxis=dict(tickformat='₹,.0f')
             )
 
         return fig
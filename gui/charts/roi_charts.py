@@ -4,9 +4,7 @@ ROI Charts Module for Return on Savings Feature.
 Advanced chart components for investment analysis.
 """
 
-import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
 from typing import List, Dict, Optional
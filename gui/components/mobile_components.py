@@ -4,11 +4,9 @@ Provides mobile-friendly versions of UI components for the Education Savings Cal
 """
 
 import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import pandas as pd
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, NamedTuple
+from functools import lru_cache
 from dataclasses import dataclass
 
 
@@ -206,81 +204,57 @@ class MobileComponentRenderer:
             st.warning("No scenarios available")
             return
 
+        # Display strings for every scenario, formatted once per distinct scenario
+        cards = [_scenario_card_text(*_scenario_fields(scenario)) for scenario in scenarios]
+
         if self.is_mobile:
             # Card layout for mobile
-            for i, scenario in enumerate(scenarios):
+            for i, card in enumerate(cards):
                 is_best = i == 0
-                self._render_scenario_card_mobile(scenario, is_best, i + 1)
+                self._render_scenario_card_mobile(card, is_best, i + 1)
         else:
             # Standard sidebar layout for larger screens
-            for i, scenario in enumerate(scenarios):
-                with st.expander(f"{i+1}. {scenario.strategy_name}", expanded=(i==0)):
-                    self._render_scenario_details(scenario)
+            for i, card in enumerate(cards):
+                with st.expander(f"{i+1}. {card.name}", expanded=(i==0)):
+                    self._render_scenario_details(card)
 
-    def _render_scenario_card_mobile(self, scenario: Any, is_best: bool, rank: int) -> None:
+    def _render_scenario_card_mobile(self, card: "ScenarioCardText", is_best: bool, rank: int) -> None:
         """Render individual scenario card for mobile."""
-        # Card styling
-        if is_best:
-            bg_color = "#e8f5e8"
-            border_color = "#4caf50"
-            badge = " BEST"
-        else:
-            bg_color = "#f8f9fa"
-            border_color = "#dee2e6"
-            badge = f"#{rank}"
-
-        card_html = f"""
-        <div style="
-            background-color: {bg_color};
-            border: 2px solid {border_color};
-            border-radius: 12px;
-            padding: 16px;
-            margin: 12px 0;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        ">
-            <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
-                <span style="font-weight: bold; color: #212529;">{scenario.strategy_name}</span>
-                <span style="background-color: {border_color}; color: white; padding: 4px 8px; border-radius: 12px; font-size: 12px;">
-                    {badge}
-                </span>
-            </div>
-        </div>
-        """
-        st.markdown(card_html, unsafe_allow_html=True)
-
-        # Metrics in card
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Total Cost", self._format_inr(scenario.total_cost_inr))
-        with col2:
-            if scenario.savings_vs_payg_inr > 0:
-                st.metric(
-                    "Savings",
-                    self._format_inr(scenario.savings_vs_payg_inr),
-                    delta=f"{scenario.savings_percentage:.1f}%"
-                )
-            else:
-                st.metric("Type", "Baseline")
+        # Card header: strategy name with rank badge (native markdown, no HTML)
+        badge = ":green[**BEST**]" if is_best else f":gray[**#{rank}**]"
+
+        with st.container(border=True):
+            name_col, badge_col = st.columns([4, 1])
+            with name_col:
+                st.markdown(f"**{card.name}**")
+            with badge_col:
+                st.markdown(badge)
+
+            # Metrics in card
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Total Cost", card.total)
+            with col2:
+                if card.savings:
+                    st.metric("Savings", card.savings, delta=card.delta)
+                else:
+                    st.metric("Type", "Baseline")
 
         # Additional details in expander
         with st.expander(" Details", expanded=False):
-            self._render_scenario_details(scenario)
+            self._render_scenario_details(card)
 
-    def _render_scenario_details(self, scenario: Any) -> None:
+    def _render_scenario_details(self, card: "ScenarioCardText") -> None:
         """Render detailed scenario information."""
-        if scenario.exchange_rate_used > 0:
-            st.metric("Exchange Rate", f"₹{scenario.exchange_rate_used:.2f}/£")
+        if card.rate:
+            st.metric("Exchange Rate", card.rate)
 
         # Breakdown details
-        breakdown = scenario.breakdown
-        if 'uk_earnings' in breakdown and breakdown['uk_earnings']['total_interest_gbp'] > 0:
-            uk_earnings = breakdown['uk_earnings']
-            st.caption(
-                f"UK Interest: £{uk_earnings['total_interest_gbp']:.0f} "
-                f"({uk_earnings['avg_interest_rate']*100:.1f}% avg BoE rate)"
-            )
+        if card.caption:
+            st.caption(card.caption)
 
-    def _format_inr(self, amount: float) -> str:
+    @staticmethod
+    def _format_inr(amount: float) -> str:
         """Format INR amounts in lakhs/crores."""
         if amount >= 10000000:  # 1 crore
             return f"₹{amount/10000000:.2f} Cr"
@@ -317,4 +291,46 @@ class MobileComponentRenderer:
         """Add mobile-specific CSS styles."""
         # CSS is now handled by the unified styles system
         # This method now focuses on mobile-specific component behavior only
-        pass
\ No newline at end of file
+        pass
+
+
+class ScenarioCardText(NamedTuple):
+    """Pre-formatted display strings for one scenario card."""
+    name: str
+    total: str
+    savings: Optional[str]
+    delta: str
+    rate: Optional[str]
+    caption: Optional[str]
+
+
+def _scenario_fields(scenario: Any) -> tuple:
+    """Hashable primitives a scenario card is rendered from."""
+    uk_earnings = scenario.breakdown.get('uk_earnings') or {}
+    return (
+        scenario.strategy_name,
+        scenario.total_cost_inr,
+        scenario.savings_vs_payg_inr,
+        scenario.savings_percentage,
+        scenario.exchange_rate_used,
+        uk_earnings.get('total_interest_gbp', 0),
+        uk_earnings.get('avg_interest_rate', 0),
+    )
+
+
+@lru_cache(maxsize=256)
+def _scenario_card_text(name: str, total_inr: float, savings_inr: float, savings_pct: float,
+                        rate: float, interest_gbp: float, interest_rate: float) -> ScenarioCardText:
+    """Format one scenario card's strings; cached so unchanged scenarios are not re-formatted."""
+    fmt = MobileComponentRenderer._format_inr
+    return ScenarioCardText(
+        name=name,
+        total=fmt(total_inr),
+        savings=fmt(savings_inr) if savings_inr > 0 else None,
+        delta=f"{savings_pct:.1f}%",
+        rate=f"₹{rate:.2f}/£" if rate > 0 else None,
+        caption=(
+            f"UK Interest: £{interest_gbp:.0f} ({interest_rate*100:.1f}% avg BoE rate)"
+            if interest_gbp > 0 else None
+        ),
+    )
@@ -8,6 +8,7 @@ using arbitrary INR amounts and leveraging the existing calculator engine.
 import streamlit as st
 import plotly.graph_objects as go
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Tuple, Optional
 import pandas as pd
 
@@ -133,6 +134,7 @@ class SecondChildAdapter:
             return None
 
 
+@lru_cache(maxsize=2048)
 def format_inr(amount: float) -> str:
     """Format INR amount in Indian number system (Lakh/Crore)."""
     if amount >= 10000000:  # 1 crore
@@ -6,10 +6,8 @@ Provides consistent card layouts and typography without breaking existing functi
 import streamlit as st
 
 
-def inject_styles():
-    """Inject professional CSS styles into the Streamlit app."""
-
-    css = """
+# Built once at import instead of on every call
+_STYLES_CSS = """
     <style>
     /* System-ui font stack for better cross-platform consistency */
     .main .block-container,
@@ -198,4 +196,7 @@ def inject_styles():
     </style>
     """
 
-    st.markdown(css, unsafe_allow_html=True)
\ No newline at end of file
+
+def inject_styles():
+    """Inject professional CSS styles into the Streamlit app."""
+    st.markdown(_STYLES_CSS, unsafe_allow_html=True)
\ No newline at end of file
@@ -0,0 +1,23 @@
+"""
+Shared helpers for the projection line charts.
+"""
+
+import numpy as np
+
+
+def split_historical_projected(years: np.ndarray, values: np.ndarray):
+    """Split year/value arrays into historical and projected series with boolean masks.
+
+    Series come back as compact typed arrays (int16 years, float32 values) so
+    Plotly ships them to the browser as binary buffers. The projected series
+    is prefixed with the last historical point so the dashed line joins the
+    solid one.
+    """
+    years = np.asarray(years, dtype=np.int16)
+    values = np.asarray(values, dtype=np.float32)
+    historical = years <= 2025
+    projected = ~historical
+    if historical.any() and projected.any():
+        projected[np.flatnonzero(historical)[-1]] = True
+
+    return years[historical], values[historical], years[projected], values[projected]
@@ -5,34 +5,33 @@ Contains chart functions and wrapper functions for clean interfaces between page
 
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
+import plotly.io as pio
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Any
 from .state import get_state, init_processors
 from .ui import format_inr, format_gbp, format_percentage
+from .chart_utils import split_historical_projected
+
+
+# Trace type for the projection line charts: WebGL by default, go.Scatter for SVG when debugging
+_SCATTER = go.Scattergl
 
 
-@st.cache_data(ttl=3600)  # Cache charts for 1 hour
 def create_fee_projection_chart(projections_data):
     """Create professional chart showing fee projections over time"""
     course_info = projections_data['course_info']
-    fee_projections = projections_data['fee_projections']
-
-    # Prepare data for chart
-    years = list(fee_projections.keys())
-    fees = list(fee_projections.values())
 
     # Historical vs projected
-    historical_years = [y for y in years if y <= 2025]
-    projected_years = [y for y in years if y > 2025]
+    historical_years, historical_fees, connect_years, connect_fees = split_historical_projected(
+        projections_data['fee_years'], projections_data['fees']
+    )
 
     fig = go.Figure()
 
     # Historical data with professional colors
-    if historical_years:
-        historical_fees = [fee_projections[y] for y in historical_years]
-        fig.add_trace(go.Scatter(
+    if historical_years.size:
+        fig.add_trace(_SCATTER(
             x=historical_years,
             y=historical_fees,
             mode='lines+markers',
@@ -43,12 +42,8 @@ def create_fee_projection_chart(projections_data):
         ))
 
     # Projected data with professional styling
-    if projected_years:
-        # Connect last historical to first projected
-        connect_years = [historical_years[-1]] + projected_years if historical_years else projected_years
-        connect_fees = [fee_projections[y] for y in connect_years]
-
-        fig.add_trace(go.Scatter(
+    if connect_years.size:
+        fig.add_trace(_SCATTER(
             x=connect_years,
             y=connect_fees,
             mode='lines+markers',
@@ -102,24 +97,19 @@ def create_fee_projection_chart(projections_data):
     return fig
 
 
-@st.cache_data(ttl=3600)  # Cache charts for 1 hour
 def create_fx_projection_chart(projections_data):
     """Create professional FX projection chart"""
-    fx_projections = projections_data['fx_projections']
-
-    years = list(fx_projections.keys())
-    rates = list(fx_projections.values())
 
     # Historical vs projected
-    historical_years = [y for y in years if y <= 2025]
-    projected_years = [y for y in years if y > 2025]
+    historical_years, historical_rates, connect_years, connect_rates = split_historical_projected(
+        projections_data['fx_years'], projections_data['fx_rates']
+    )
 
     fig = go.Figure()
 
     # Historical data with professional colors
-    if historical_years:
-        historical_rates = [fx_projections[y] for y in historical_years]
-        fig.add_trace(go.Scatter(
+    if historical_years.size:
+        fig.add_trace(_SCATTER(
             x=historical_years,
             y=historical_rates,
             mode='lines+markers',
@@ -130,11 +120,8 @@ def create_fx_projection_chart(projections_data):
         ))
 
     # Projected data with professional styling
-    if projected_years:
-        connect_years = [historical_years[-1]] + projected_years if historical_years else projected_years
-        connect_rates = [fx_projections[y] for y in connect_years]
-
-        fig.add_trace(go.Scatter(
+    if connect_years.size:
+        fig.add_trace(_SCATTER(
             x=connect_years,
             y=connect_rates,
             mode='lines+markers',
@@ -188,18 +175,41 @@ def create_fx_projection_chart(projections_data):
     return fig
 
 
+@st.cache_data(show_spinner=False)
 def get_payg_projection(university: str, course: str, start_year: int, edu_year: int, duration: int = 3):
     """Get pay-as-you-go projection data"""
     data_processor, calculator = init_processors()
     return calculator.get_projection_details(university, course, edu_year)
 
 
+@st.cache_data(ttl=3600, show_spinner=False)  # Cache charts for 1 hour
+def _fee_chart_json(university: str, course: str, edu_year: int) -> str:
+    """Fee projection figure as JSON, keyed on the scalar inputs rather than the projection dict"""
+    return create_fee_projection_chart(get_payg_projection(university, course, edu_year, edu_year)).to_json()
+
+
+@st.cache_data(ttl=3600, show_spinner=False)  # Cache charts for 1 hour
+def _fx_chart_json(university: str, course: str, edu_year: int) -> str:
+    """FX projection figure as JSON, keyed on the scalar inputs rather than the projection dict"""
+    return create_fx_projection_chart(get_payg_projection(university, course, edu_year, edu_year)).to_json()
+
+
+def projection_charts(university: str, course: str, edu_year: int):
+    """Fee and FX projection figures for a course, rebuilt from cached JSON"""
+    return (
+        pio.from_json(_fee_chart_json(university, course, edu_year)),
+        pio.from_json(_fx_chart_json(university, course, edu_year)),
+    )
+
+
+@st.cache_data(show_spinner=False)
 def compare_strategies(university: str, course: str, conversion_year: int, education_year: int):
     """Compare all savings strategies"""
     data_processor, calculator = init_processors()
     return calculator.compare_all_strategies(university, course, conversion_year, education_year)
 
 
+@st.cache_data(show_spinner=False)
 def get_roi_scenarios(university: str, course: str, conversion_year: int, education_year: int,
                      investment_amount: float, strategies: List[str]):
     """Get ROI investment scenarios"""
@@ -209,23 +219,28 @@ def get_roi_scenarios(university: str, course: str, conversion_year: int, educat
     )
 
 
-@st.cache_data(ttl=1800)  # Cache for 30 minutes
 def create_strategy_comparison_chart(scenarios):
-    """Create professional bar chart comparing strategy costs"""
+    """Create professional bar chart comparing strategy costs
+
+    Accepts a ScenarioBatch or a list of scenarios (converted to a batch).
+    """
     if not scenarios:
         return None
 
-    strategy_names = [scenario.strategy_name for scenario in scenarios]
-    total_costs = [scenario.total_cost_inr for scenario in scenarios]
+    from gui.fee_calculator import ScenarioBatch
+
+    batch = scenarios if isinstance(scenarios, ScenarioBatch) else ScenarioBatch.from_scenarios(scenarios)
+    strategy_names = batch.names
+    total_costs = batch.cost_inr
 
     # Format costs in lakhs for better readability
-    formatted_costs = [cost / 100000 for cost in total_costs]  # Convert to lakhs
+    formatted_costs = total_costs / 100000  # Convert to lakhs
     hover_texts = [f"<b>{name}</b><br>Cost: ₹{cost:,.0f}<br>({cost/100000:.1f}L)"
-                   for name, cost in zip(strategy_names, total_costs)]
+                   for name, cost in zip(strategy_names, total_costs.tolist())]
 
     # Professional color scheme - highlight best strategy
-    colors = ['#059669' if i == 0 else '#1E40AF' if i == 1 else '#374151'
-              for i in range(len(scenarios))]
+    colors = np.full(len(batch), '#374151', dtype=object)
+    colors[:2] = ['#059669', '#1E40AF'][:len(batch)]
 
     fig = go.Figure(data=[go.Bar(
         x=strategy_names,
@@ -273,20 +288,38 @@ def create_strategy_comparison_chart(scenarios):
         showlegend=False
     )
 
-    # Add value labels on bars for better readability
-    for i, (cost_lakhs, cost_total) in enumerate(zip(formatted_costs, total_costs)):
-        fig.add_annotation(
-            x=strategy_names[i],
-            y=cost_lakhs + max(formatted_costs) * 0.08,  # Raised higher above bars for better readability
+    # Add value labels on bars for better readability (one layout update for all labels)
+    label_y = formatted_costs + formatted_costs.max() * 0.08  # Raised higher above bars for better readability
+    fig.update_layout(annotations=[
+        dict(
+            x=name,
+            y=y,
             text=f"₹{cost_lakhs:.1f}L",
             showarrow=False,
             font=dict(color='#374151', size=12, family="system-ui"),
             xanchor='center'
         )
+        for name, y, cost_lakhs in zip(strategy_names, label_y.tolist(), formatted_costs.tolist())
+    ])
 
     return fig
 
 
+@st.cache_data(ttl=1800, show_spinner=False)  # Cache for 30 minutes
+def _strategy_chart_json(university: str, course: str, conversion_year: int, education_year: int) -> str:
+    """Strategy cost comparison figure as JSON, keyed on the scalar inputs rather than the scenario list"""
+    scenarios = compare_strategies(university, course, conversion_year, education_year)
+    fig = create_strategy_comparison_chart(scenarios)
+    return fig.to_json() if fig is not None else ""
+
+
+def strategy_comparison_chart(university: str, course: str, conversion_year: int, education_year: int):
+    """Strategy cost comparison figure for a selection, rebuilt from cached JSON"""
+    fig_json = _strategy_chart_json(university, course, conversion_year, education_year)
+    return pio.from_json(fig_json) if fig_json else None
+
+
+@st.cache_data(show_spinner=False)
 def get_course_info(university: str, course: str):
     """Get course information from data processor"""
     data_processor, calculator = init_processors()
@@ -307,13 +340,36 @@ def get_courses(university: str):
     return data_processor.get_courses(university)
 
 
+@st.cache_data(show_spinner=False)
 def project_fee(university: str, course: str, year: int):
     """Project fee for a specific year"""
     data_processor, calculator = init_processors()
     return data_processor.project_fee(university, course, year)
 
 
+@st.cache_data(show_spinner=False)
 def project_fx_rate(year: int):
     """Project exchange rate for a specific year"""
     data_processor, calculator = init_processors()
-    return data_processor.project_fx_rate(year)
\ No newline at end of file
+    return data_processor.project_fx_rate(year)
+
+
+def project_fx_rates(years):
+    """Project exchange rates for an array of years"""
+    data_processor, calculator = init_processors()
+    return data_processor.project_fx_rate_vec(years)
+
+
+@st.cache_data(show_spinner=False)
+def fx_forecast_table(start_year: int, end_year: int, with_impact: bool = False) -> pd.DataFrame:
+    """Exchange rate forecast table for start_year..end_year (inclusive), built once per range"""
+    fx_years = np.arange(start_year, end_year + 1)
+    fx_rates = project_fx_rates(fx_years)
+    fx_df = pd.DataFrame({
+        'Year': fx_years,
+        'Rate (₹/£)': np.char.mod("₹%.2f", fx_rates),
+        'Status': np.where(fx_years <= 2025, "Historical", "Projected")
+    })
+    if with_impact:
+        fx_df['Impact'] = np.where(fx_rates < 100, 'Lower rates favor early conversion', 'Higher rates favor late payment')
+    return fx_df
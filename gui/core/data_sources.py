@@ -84,8 +84,12 @@ def create_download_button(file_path: Path, label: str, description: str, help_t
         st.error(f"Error reading file {file_path.name}: {str(e)}")
 
 
+@st.fragment
 def data_sources_section():
-    """Create the data sources section with downloadable CSV files."""
+    """Create the data sources section with downloadable CSV files.
+
+    Runs as a fragment: its download buttons only rerun this section, not the whole app.
+    """
 
     # Get data directory path
     current_dir = Path(__file__).parent.parent.parent
@@ -12,12 +12,66 @@ from .ui_components import (
     format_percentage, format_exchange_rate, selected_strategy_card
 )
 from .compute import (
-    get_universities, get_courses, get_course_info, get_payg_projection,
-    create_fee_projection_chart, create_fx_projection_chart, compare_strategies,
-    create_strategy_comparison_chart, project_fx_rate
+    get_universities, get_courses, get_course_info, project_fee, get_payg_projection,
+    projection_charts, compare_strategies,
+    strategy_comparison_chart, fx_forecast_table
 )
 
 
+@st.cache_data(show_spinner=False)
+def _scenario_rows(university: str, course: str, conversion_year: int, education_year: int):
+    """Pre-formatted display strings for each strategy, built once per selection."""
+    rows = []
+    for scenario in compare_strategies(university, course, conversion_year, education_year):
+        has_savings = scenario.savings_vs_payg_inr > 0
+        uk_earnings = scenario.breakdown.get('uk_earnings')
+        rows.append({
+            'name': scenario.strategy_name,
+            'cost': format_inr(scenario.total_cost_inr),
+            'savings': format_inr(scenario.savings_vs_payg_inr) if has_savings else None,
+            'pct': format_percentage(scenario.savings_percentage),
+            'has_pct': scenario.savings_percentage > 0,
+            'rate': f"₹{scenario.exchange_rate_used:.2f}/£" if scenario.exchange_rate_used > 0 else None,
+            'interest': (
+                f"UK Interest: £{uk_earnings['total_interest_gbp']:.0f} "
+                f"({uk_earnings['avg_interest_rate']*100:.1f}% avg BoE rate)"
+                if uk_earnings and uk_earnings['total_interest_gbp'] > 0 else None
+            ),
+        })
+    return rows
+
+
+def _strategy_details(row: dict, expanded: bool = False) -> None:
+    """Expander with the metrics for one pre-formatted strategy row."""
+    with st.expander(f"{row['name']} - Details", expanded=expanded):
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Total Cost", row['cost'])
+        with col2:
+            if row['savings']:
+                st.metric("Savings", row['savings'], delta=row['pct'])
+            else:
+                st.info("Baseline comparison")
+        with col3:
+            if row['rate']:
+                st.metric("Exchange Rate", row['rate'])
+
+        # Additional breakdown if available
+        if row['interest']:
+            st.caption(row['interest'])
+
+
+@st.fragment
+def _other_strategy_details(rows: list) -> None:
+    """Details for the remaining strategies, built only once the user asks for them."""
+    # Expanders do not report being opened, so a toggle gates the work; flipping
+    # it reruns just this fragment rather than the whole page
+    if st.toggle(f"Show details for {len(rows)} other strategies", key="show_other_strategy_details"):
+        for row in rows:
+            _strategy_details(row)
+
+
 def course_selector_section():
     """Course Selector section - previously page 1"""
 
@@ -95,7 +149,7 @@ def course_selector_section():
                 # Data quality information
                 transparency = course_info.get('transparency')
                 if transparency:
-                    st.info(f"**Data Quality:** {transparency.data_quality.value.title()} | **Confidence:** {transparency.confidence_level.value.title()}")
+                    st.info(f"**Data Quality:** {transparency.quality_label} | **Confidence:** {transparency.confidence_label}")
 
                 # Update state
                 update_state(university=university, course=course)
@@ -105,8 +159,14 @@ def course_selector_section():
         st.info("Please check that the data files are available and try refreshing the page.")
 
 
+@st.fragment
 def projections_section():
-    """Pay-As-You-Go Projections section - previously page 2"""
+    """Pay-As-You-Go Projections section - previously page 2
+
+    Runs as a fragment: programme length and fee CAGR only affect this
+    section, so changing them reruns it alone. A timeline change feeds the
+    strategy and summary sections below and reruns the whole app.
+    """
 
     st.subheader("2. Fee & Exchange Rate Projections")
     st.caption("Fee and exchange rate forecasts for your education timeline")
@@ -118,8 +178,6 @@ def projections_section():
         return
 
     try:
-        data_processor, calculator = init_processors()
-
         # Timeline inputs
         col1, col2, col3, col4 = st.columns(4)
 
@@ -152,7 +210,7 @@ def projections_section():
             )
 
         with col4:
-            course_info = data_processor.get_course_info(state.university, state.course)
+            course_info = get_course_info(state.university, state.course)
             default_cagr = course_info.get('cagr_pct', 5.0)
             cagr = st.slider(
                 "Fee CAGR (%)",
@@ -162,7 +220,15 @@ def projections_section():
                 key="fee_cagr"
             )
 
+        # Later sections read the timeline from state, so refresh the page when it changes
+        timeline = (start_year, edu_start)
+        if st.session_state.get('projections_timeline', timeline) != timeline:
+            st.session_state['projections_timeline'] = timeline
+            st.rerun(scope="app")
+        st.session_state['projections_timeline'] = timeline
+
         # Input validation with helpful feedback
+        update_state(timeline_valid=edu_start > start_year)
         if edu_start <= start_year:
             st.error("⚠️ **Invalid Timeline**: Education start year must be after savings start year")
             st.info("💡 **Suggestion**: Set education start year to at least " + str(start_year + 1))
@@ -176,7 +242,7 @@ def projections_section():
 
             if projections_data:
                 # Calculate key metrics
-                projected_annual_fee = data_processor.project_fee(state.university, state.course, edu_start)
+                projected_annual_fee = project_fee(state.university, state.course, edu_start)
                 projected_total = projected_annual_fee * duration
                 latest_fee = course_info.get('latest_fee', 0)
                 current_total = latest_fee * duration
@@ -212,29 +278,20 @@ def projections_section():
 
                 # Charts
                 st.markdown("**Projections**")
+                fee_chart, fx_chart = projection_charts(state.university, state.course, edu_start)
                 chart_col1, chart_col2 = st.columns(2)
 
                 with chart_col1:
-                    fee_chart = create_fee_projection_chart(projections_data)
                     st.plotly_chart(fee_chart, use_container_width=True)
 
                 with chart_col2:
-                    fx_chart = create_fx_projection_chart(projections_data)
                     st.plotly_chart(fx_chart, use_container_width=True)
 
                 # Exchange rate forecast table
                 st.markdown("**Exchange Rate Forecast**")
-                fx_data = []
-                for year in range(start_year, edu_start + duration):
-                    rate = project_fx_rate(year)
-                    status = "Historical" if year <= 2025 else "Projected"
-                    fx_data.append({
-                        'Year': year,
-                        'Rate (₹/£)': f"₹{rate:.2f}",
-                        'Status': status
-                    })
-
-                st.dataframe(pd.DataFrame(fx_data), use_container_width=True)
+                fx_df = fx_forecast_table(start_year, edu_start + duration - 1)
+
+                st.dataframe(fx_df, use_container_width=True)
                 st.caption("FX projections based on 8-year historical CAGR (4.18% annual depreciation, 2017-2025). Actual rates may vary due to economic conditions.")
 
                 # Update state
@@ -266,10 +323,12 @@ def strategy_selector_section():
     elif not state.conversion_year or not state.education_year:
         st.warning("Please complete the Projections section above first.")
         return
+    elif not state.timeline_valid:
+        # Skip the strategy comparison until the timeline above is fixed
+        st.warning("Please fix the timeline in the Projections section above.")
+        return
 
     try:
-        data_processor, calculator = init_processors()
-
         # Strategy selection
         st.markdown("**Choose Your Savings Strategy**")
 
@@ -306,7 +365,12 @@ def strategy_selector_section():
         if scenarios:
             # Display comparison chart
             st.markdown("**Strategy Comparison**")
-            comparison_chart = create_strategy_comparison_chart(scenarios)
+            comparison_chart = strategy_comparison_chart(
+                state.university,
+                state.course,
+                state.conversion_year,
+                state.education_year
+            )
             if comparison_chart:
                 st.plotly_chart(comparison_chart, use_container_width=True)
 
@@ -341,42 +405,28 @@ def strategy_selector_section():
             # Strategy comparison table
             st.markdown("**Detailed Comparison**")
 
-            comparison_data = []
-            for scenario in scenarios:
-                comparison_data.append({
-                    'Strategy': scenario.strategy_name,
-                    'Total Cost (INR)': format_inr(scenario.total_cost_inr),
-                    'Savings vs PAYG': format_inr(scenario.savings_vs_payg_inr) if scenario.savings_vs_payg_inr > 0 else "Baseline",
-                    'Savings %': format_percentage(scenario.savings_percentage) if scenario.savings_percentage > 0 else "0%",
-                    'Exchange Rate': f"₹{scenario.exchange_rate_used:.2f}/£" if scenario.exchange_rate_used > 0 else "Variable"
-                })
+            rows = _scenario_rows(
+                state.university,
+                state.course,
+                state.conversion_year,
+                state.education_year
+            )
+            comparison_df = pd.DataFrame({
+                'Strategy': [row['name'] for row in rows],
+                'Total Cost (INR)': [row['cost'] for row in rows],
+                'Savings vs PAYG': [row['savings'] or "Baseline" for row in rows],
+                'Savings %': [row['pct'] if row['has_pct'] else "0%" for row in rows],
+                'Exchange Rate': [row['rate'] or "Variable" for row in rows]
+            })
 
             # Use professional dataframe with proper column configuration
-            comparison_df = pd.DataFrame(comparison_data)
             professional_dataframe(comparison_df)
 
-            # Strategy details
-            for i, scenario in enumerate(scenarios):
-                with st.expander(f"{scenario.strategy_name} - Details", expanded=(i==0)):
-
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Total Cost", format_inr(scenario.total_cost_inr))
-                    with col2:
-                        if scenario.savings_vs_payg_inr > 0:
-                            st.metric("Savings", format_inr(scenario.savings_vs_payg_inr),
-                                     delta=format_percentage(scenario.savings_percentage))
-                        else:
-                            st.info("Baseline comparison")
-                    with col3:
-                        if scenario.exchange_rate_used > 0:
-                            st.metric("Exchange Rate", f"₹{scenario.exchange_rate_used:.2f}/£")
-
-                    # Additional breakdown if available
-                    breakdown = scenario.breakdown
-                    if 'uk_earnings' in breakdown and breakdown['uk_earnings']['total_interest_gbp'] > 0:
-                        uk_earnings = breakdown['uk_earnings']
-                        st.caption(f"UK Interest: £{uk_earnings['total_interest_gbp']:.0f} ({uk_earnings['avg_interest_rate']*100:.1f}% avg BoE rate)")
+            # Strategy details: the best strategy up front, the rest only on request
+            if rows:
+                _strategy_details(rows[0], expanded=True)
+                if len(rows) > 1:
+                    _other_strategy_details(rows[1:])
 
             # Update state with scenarios and selected strategy
             update_state(scenarios=scenarios, selected_strategy=selected_strategy)
@@ -400,6 +450,9 @@ def summary_section():
     if not state.university or not state.course or not state.scenarios:
         st.warning("Please complete all previous sections to see your summary.")
         return
+    elif not state.timeline_valid:
+        st.warning("Please fix the timeline in the Projections section above to see your summary.")
+        return
 
     try:
         # Get best scenario and user's selected strategy
@@ -491,18 +544,7 @@ def summary_section():
             # Exchange rate forecast
             st.markdown("**Exchange Rate Forecast**")
 
-            fx_data = []
-            for year in range(state.conversion_year, state.education_year + 3):
-                rate = project_fx_rate(year)
-                status = "Historical" if year <= 2025 else "Projected"
-                fx_data.append({
-                    'Year': year,
-                    'Rate (₹/£)': f"₹{rate:.2f}",
-                    'Status': status,
-                    'Impact': 'Lower rates favor early conversion' if rate < 100 else 'Higher rates favor late payment'
-                })
-
-            fx_df = pd.DataFrame(fx_data)
+            fx_df = fx_forecast_table(state.conversion_year, state.education_year + 2, with_impact=True)
             professional_dataframe(fx_df)
             st.caption("Exchange rate projections based on historical trends. Actual rates may vary due to economic conditions.")
 
@@ -9,6 +9,7 @@ class AppState:
     course: Optional[str] = "Philosophy Politics & Economics"
     conversion_year: int = 2025
     education_year: int = 2027
+    timeline_valid: bool = True  # False while the Projections inputs are invalid
 
     # Calculation results (cached)
     scenarios: List = field(default_factory=list)
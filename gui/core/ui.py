@@ -1,4 +1,7 @@
 import streamlit as st
+import numpy as np
+from bisect import bisect_right
+from functools import lru_cache
 from typing import List, Tuple
 
 def kpi_row(items: List[Tuple[str, str, str]]):
@@ -31,19 +34,54 @@ def inline_svg_arrow(size: int = 18) -> str:
     </svg>
     """
 
+# INR display tiers: (divisor, template), selected by bisecting the lakh/crore thresholds
+_INR_THRESHOLDS = (100000, 10000000)  # 1 lakh, 1 crore
+_INR_TIERS = (
+    (1, "₹{:,.0f}"),
+    (100000, "₹{:.2f} L"),
+    (10000000, "₹{:.2f} Cr"),
+)
+# One-decimal, unspaced variant used by the compact KPI components
+_INR_TIERS_COMPACT = (
+    (1, "₹{:,.0f}"),
+    (100000, "₹{:.1f}L"),
+    (10000000, "₹{:.1f}Cr"),
+)
+
+def _format_inr_tiered(amount: float, tiers) -> str:
+    divisor, template = tiers[bisect_right(_INR_THRESHOLDS, amount)]
+    return template.format(amount / divisor)
+
+@lru_cache(maxsize=2048)
 def format_inr(amount: float) -> str:
     """Format INR amounts in lakhs/crores"""
-    if amount >= 10000000:  # 1 crore
-        return f"₹{amount/10000000:.2f} Cr"
-    elif amount >= 100000:  # 1 lakh
-        return f"₹{amount/100000:.2f} L"
-    else:
-        return f"₹{amount:,.0f}"
+    return _format_inr_tiered(amount, _INR_TIERS)
+
+@lru_cache(maxsize=2048)
+def format_inr_compact(amount: float) -> str:
+    """Format INR amounts in lakhs/crores to one decimal place"""
+    return _format_inr_tiered(amount, _INR_TIERS_COMPACT)
+
+def format_inr_vec(amounts: np.ndarray) -> np.ndarray:
+    """Format an array of INR amounts in lakhs/crores, matching format_inr"""
+    amounts = np.asarray(amounts, dtype=float)
+    crore = amounts >= 10000000
+    lakh = ~crore & (amounts >= 100000)
+    rest = ~(crore | lakh)
+
+    formatted = np.empty(amounts.shape, dtype=object)
+    formatted[crore] = np.char.add(np.char.mod("₹%.2f", amounts[crore] / 10000000), " Cr")
+    formatted[lakh] = np.char.add(np.char.mod("₹%.2f", amounts[lakh] / 100000), " L")
+    # Thousands separators have no %-format equivalent
+    formatted[rest] = [f"₹{amount:,.0f}" for amount in amounts[rest]]
+    return formatted
 
+@lru_cache(maxsize=2048)
 def format_gbp(amount: float) -> str:
     """Format GBP amounts"""
     return f"£{amount:,.0f}"
 
+@lru_cache(maxsize=2048)
 def format_percentage(pct: float) -> str:
     """Format percentage"""
     return f"{pct:.1f}%"
\ No newline at end of file
@@ -8,7 +8,11 @@ import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 from typing import List, Dict, Any, Optional, Union
-from datetime import datetime
+from contextlib import contextmanager
+from functools import lru_cache
+
+# INR tiers live in ui.py; components use its one-decimal compact style
+from .ui import format_inr_compact as format_inr, format_gbp, format_percentage
 
 # ===== PROFESSIONAL KPI COMPONENTS =====
 
@@ -70,6 +74,36 @@ def selected_strategy_card(strategy_name: str) -> None:
 
 # ===== PROFESSIONAL DATA COMPONENTS =====
 
+# Column configs are built once; an unset label falls back to the column name
+_INR_COLUMN = st.column_config.NumberColumn(format="₹%.0f", help="Amount in Indian Rupees")
+_GBP_COLUMN = st.column_config.NumberColumn(format="£%.0f", help="Amount in British Pounds")
+_PERCENT_COLUMN = st.column_config.NumberColumn(format="%.2f%%", help="Percentage value")
+_YEAR_COLUMN = st.column_config.NumberColumn(format="%d", help="Year value")
+
+_MONEY_KEYWORDS = ('amount', 'cost', 'fee', 'price', 'inr', 'gbp')
+_CURRENCY_RULES = (('inr', _INR_COLUMN), ('gbp', _GBP_COLUMN))
+_RATE_KEYWORDS = ('rate', 'percentage', '%')
+_NUMERIC_DTYPES = ('float64', 'int64')
+
+
+@lru_cache(maxsize=64)
+def _default_column_config(columns: tuple, dtypes: tuple) -> Dict:
+    """Auto-configure common column types from column names and dtypes."""
+    default_config = {}
+    for col, dtype in zip(columns, dtypes):
+        cname = col.lower()
+        if dtype in _NUMERIC_DTYPES:
+            if any(keyword in cname for keyword in _MONEY_KEYWORDS):
+                cfg = next((c for suffix, c in _CURRENCY_RULES if suffix in cname), None)
+                if cfg is not None:
+                    default_config[col] = cfg
+            elif any(keyword in cname for keyword in _RATE_KEYWORDS):
+                default_config[col] = _PERCENT_COLUMN
+        elif 'year' in cname:
+            default_config[col] = _YEAR_COLUMN
+    return default_config
+
+
 def professional_dataframe(data: pd.DataFrame,
                           column_config: Optional[Dict] = None,
                           key: Optional[str] = None) -> None:
@@ -81,36 +115,7 @@ def professional_dataframe(data: pd.DataFrame,
         column_config: Optional column configuration
         key: Optional key for the dataframe widget
     """
-    default_config = {}
-
-    # Auto-configure common column types
-    for col in data.columns:
-        if data[col].dtype in ['float64', 'int64']:
-            if any(keyword in col.lower() for keyword in ['amount', 'cost', 'fee', 'price', 'inr', 'gbp']):
-                if 'inr' in col.lower() or '₹' in str(data[col].iloc[0] if len(data) > 0 else ''):
-                    default_config[col] = st.column_config.NumberColumn(
-                        col,
-                        format="₹%.0f",
-                        help=f"Amount in Indian Rupees"
-                    )
-                elif 'gbp' in col.lower() or '£' in str(data[col].iloc[0] if len(data) > 0 else ''):
-                    default_config[col] = st.column_config.NumberColumn(
-                        col,
-                        format="£%.0f",
-                        help=f"Amount in British Pounds"
-                    )
-            elif any(keyword in col.lower() for keyword in ['rate', 'percentage', '%']):
-                default_config[col] = st.column_config.NumberColumn(
-                    col,
-                    format="%.2f%%",
-                    help=f"Percentage value"
-                )
-        elif 'year' in col.lower():
-            default_config[col] = st.column_config.NumberColumn(
-                col,
-                format="%d",
-                help=f"Year value"
-            )
+    default_config = dict(_default_column_config(tuple(data.columns), tuple(data.dtypes)))
 
     # Merge with user-provided config
     if column_config:
@@ -126,39 +131,40 @@ def professional_dataframe(data: pd.DataFrame,
 
 # ===== PROFESSIONAL CHART COMPONENTS =====
 
+_AXIS_STYLE = dict(
+    gridcolor='#E2E8F0',
+    showgrid=True,
+    linecolor='#E2E8F0',
+    tickcolor='#6B7280',
+    title=dict(font=dict(color='#374151'))
+)
+
+# Everything except the title and the title-dependent top margin
+_BASE_LAYOUT = {
+    'paper_bgcolor': 'rgba(0,0,0,0)',
+    'plot_bgcolor': 'rgba(0,0,0,0)',
+    'font': dict(family="system-ui, -apple-system, sans-serif", size=14),
+    'xaxis': _AXIS_STYLE,
+    'yaxis': _AXIS_STYLE,
+    'legend': dict(
+        orientation="h",
+        y=-0.15,
+        font=dict(color='#374151')
+    )
+}
+_MARGIN_WITH_TITLE = dict(l=20, r=20, t=40, b=20)
+_MARGIN_NO_TITLE = dict(l=20, r=20, t=20, b=20)
+_TITLE_FONT = dict(size=18, color='#0F172A')
+
+
 def create_professional_chart_layout(title: Optional[str] = None) -> Dict:
     """
     Standard professional chart layout configuration
     """
     return {
-        'paper_bgcolor': 'rgba(0,0,0,0)',
-        'plot_bgcolor': 'rgba(0,0,0,0)',
-        'font': dict(family="system-ui, -apple-system, sans-serif", size=14),
-        'margin': dict(l=20, r=20, t=40 if title else 20, b=20),
-        'title': dict(
-            text=title,
-            font=dict(size=18, color='#0F172A'),
-            x=0.05
-        ) if title else None,
-        'xaxis': dict(
-            gridcolor='#E2E8F0',
-            showgrid=True,
-            linecolor='#E2E8F0',
-            tickcolor='#6B7280',
-            titlefont=dict(color='#374151')
-        ),
-        'yaxis': dict(
-            gridcolor='#E2E8F0',
-            showgrid=True,
-            linecolor='#E2E8F0',
-            tickcolor='#6B7280',
-            titlefont=dict(color='#374151')
-        ),
-        'legend': dict(
-            orientation="h",
-            y=-0.15,
-            font=dict(color='#374151')
-        )
+        **_BASE_LAYOUT,
+        'margin': _MARGIN_WITH_TITLE if title else _MARGIN_NO_TITLE,
+        'title': dict(text=title, font=_TITLE_FONT, x=0.05) if title else None,
     }
 
 def professional_line_chart(data: pd.DataFrame, x: str, y: str,
@@ -167,16 +173,9 @@ def professional_line_chart(data: pd.DataFrame, x: str, y: str,
     """
     Create a professional line chart
     """
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        x=data[x],
-        y=data[y],
-        mode='lines+markers',
-        line=dict(color=color, width=3),
-        marker=dict(color=color, size=6),
-        name=y
-    ))
-
+    fig = px.line(data, x=x, y=y, markers=True).update_traces(
+        line_color=color, line_width=3, marker_color=color, marker_size=6, name=y
+    )
     fig.update_layout(**create_professional_chart_layout(title))
     return fig
 
@@ -186,14 +185,7 @@ def professional_bar_chart(data: pd.DataFrame, x: str, y: str,
     """
     Create a professional bar chart
     """
-    fig = go.Figure()
-    fig.add_trace(go.Bar(
-        x=data[x],
-        y=data[y],
-        marker_color=color,
-        name=y
-    ))
-
+    fig = px.bar(data, x=x, y=y).update_traces(marker_color=color, name=y)
     fig.update_layout(**create_professional_chart_layout(title))
     return fig
 
@@ -283,23 +275,7 @@ def error_alert(message: str) -> None:
 
 # ===== FORMATTING UTILITIES =====
 
-def format_inr(amount: float) -> str:
-    """Format amount in Indian Rupees"""
-    if amount >= 10000000:  # 1 crore
-        return f"₹{amount/10000000:.1f}Cr"
-    elif amount >= 100000:  # 1 lakh
-        return f"₹{amount/100000:.1f}L"
-    else:
-        return f"₹{amount:,.0f}"
-
-def format_gbp(amount: float) -> str:
-    """Format amount in British Pounds"""
-    return f"£{amount:,.0f}"
-
-def format_percentage(value: float) -> str:
-    """Format percentage value"""
-    return f"{value:.1f}%"
-
+@lru_cache(maxsize=2048)
 def format_exchange_rate(rate: float) -> str:
     """Format exchange rate"""
     return f"₹{rate:.2f}/£"
@@ -353,14 +329,31 @@ def show_loading_state(message: str = "Loading..."):
 
 def show_progress_bar(progress: float, message: str = "Processing"):
     """Show professional progress bar"""
-    progress_bar = st.progress(0)
+    progress_bar = st.progress(progress)
     status_text = st.empty()
-
-    progress_bar.progress(progress)
     status_text.text(f'{message}: {int(progress * 100)}%')
 
     return progress_bar, status_text
 
+@contextmanager
+def progress_context(message: str = "Processing"):
+    """
+    Professional progress bar that is created once and updated in place
+
+    Yields an update(progress) callable; the widgets are cleared on exit.
+    """
+    progress_bar, status_text = show_progress_bar(0.0, message)
+
+    def update(progress: float) -> None:
+        progress_bar.progress(progress)
+        status_text.text(f'{message}: {int(progress * 100)}%')
+
+    try:
+        yield update
+    finally:
+        progress_bar.empty()
+        status_text.empty()
+
 # ===== INPUT VALIDATION HELPERS =====
 
 def validate_required_fields(fields: Dict[str, Any]) -> List[str]:
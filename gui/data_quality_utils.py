@@ -3,33 +3,38 @@ Data quality utilities for education savings calculator.
 Provides transparency features and data quality indicators.
 """
 
-from enum import Enum
-from dataclasses import dataclass
-from typing import List, Optional
+from bisect import bisect_right
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import Optional, Tuple
 
 
-class DataQuality(Enum):
+class DataQuality:
     """Data quality levels based on years of historical data"""
     EXCELLENT = "excellent"      # 5+ years of data
     GOOD = "good"               # 3-4 years of data
     LIMITED = "limited"         # 2 years of data
     INSUFFICIENT = "insufficient"  # 1 year only
 
+    LEVELS = (EXCELLENT, GOOD, LIMITED, INSUFFICIENT)
 
-class ConfidenceLevel(Enum):
+
+class ConfidenceLevel:
     """Confidence levels for projections"""
     HIGH = "high"       # Course-specific CAGR with good data
     MEDIUM = "medium"   # Course-specific CAGR with limited data
     LOW = "low"         # University average CAGR used
 
+    LEVELS = (HIGH, MEDIUM, LOW)
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DataTransparency:
-    """Complete transparency information for a course analysis"""
-    data_quality: DataQuality
-    confidence_level: ConfidenceLevel
+    """Complete transparency information for a course analysis (hashable, so it can key caches)"""
+    data_quality: str         # One of DataQuality.LEVELS
+    confidence_level: str     # One of ConfidenceLevel.LEVELS
     years_of_data: int
-    actual_data_years: List[int]
+    actual_data_years: Tuple[int, ...]
     latest_actual_year: int
     is_using_university_average: bool
     university_average_cagr: float
@@ -37,52 +42,69 @@ class DataTransparency:
     calculation_method: str
     source_verification: str
 
+    # Display values derived once on construction
+    quality_label: str = field(init=False)
+    confidence_label: str = field(init=False)
+    first_year: Optional[int] = field(init=False)
+    last_year: Optional[int] = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'quality_label', self.data_quality.title())
+        object.__setattr__(self, 'confidence_label', self.confidence_level.title())
+        object.__setattr__(self, 'first_year', min(self.actual_data_years) if self.actual_data_years else None)
+        object.__setattr__(self, 'last_year', max(self.actual_data_years) if self.actual_data_years else None)
+
+
+# Minimum years of data for each level above INSUFFICIENT
+_QUALITY_THRESHOLDS = (2, 3, 5)
+_QUALITY_LEVELS = (
+    DataQuality.INSUFFICIENT,
+    DataQuality.LIMITED,
+    DataQuality.GOOD,
+    DataQuality.EXCELLENT,
+)
 
-def assess_data_quality(years_of_data: int) -> DataQuality:
+
+def assess_data_quality(years_of_data: int) -> str:
     """Assess data quality based on number of years"""
-    if years_of_data >= 5:
-        return DataQuality.EXCELLENT
-    elif years_of_data >= 3:
-        return DataQuality.GOOD
-    elif years_of_data == 2:
-        return DataQuality.LIMITED
-    else:
-        return DataQuality.INSUFFICIENT
+    return _QUALITY_LEVELS[bisect_right(_QUALITY_THRESHOLDS, years_of_data)]
 
 
-def determine_confidence_level(data_quality: DataQuality, using_university_average: bool) -> ConfidenceLevel:
+def determine_confidence_level(data_quality: str, using_university_average: bool) -> str:
     """Determine confidence level based on data quality and calculation method"""
     if using_university_average:
         return ConfidenceLevel.LOW
-    elif data_quality in [DataQuality.EXCELLENT, DataQuality.GOOD]:
+    elif data_quality in (DataQuality.EXCELLENT, DataQuality.GOOD):
         return ConfidenceLevel.HIGH
     else:
         return ConfidenceLevel.MEDIUM
 
 
-def get_data_quality_badge(data_quality: DataQuality) -> tuple[str, str]:
+_BADGES = {
+    DataQuality.EXCELLENT: ("", "#22c55e"),
+    DataQuality.GOOD: ("", "#eab308"),
+    DataQuality.LIMITED: ("", "#f97316"),
+    DataQuality.INSUFFICIENT: ("", "#ef4444")
+}
+
+_INDICATORS = {
+    ConfidenceLevel.HIGH: ("", "High confidence - course-specific data"),
+    ConfidenceLevel.MEDIUM: ("", "Medium confidence - limited course data"),
+    ConfidenceLevel.LOW: ("", "Low confidence - university average used")
+}
+
+
+def get_data_quality_badge(data_quality: str) -> tuple[str, str]:
     """Get emoji and color for data quality badge"""
-    badges = {
-        DataQuality.EXCELLENT: ("", "#22c55e"),
-        DataQuality.GOOD: ("", "#eab308"),
-        DataQuality.LIMITED: ("", "#f97316"),
-        DataQuality.INSUFFICIENT: ("", "#ef4444")
-    }
-    return badges[data_quality]
+    return _BADGES[data_quality]
 
 
-def get_confidence_indicator(confidence_level: ConfidenceLevel) -> tuple[str, str]:
+def get_confidence_indicator(confidence_level: str) -> tuple[str, str]:
     """Get emoji and description for confidence level"""
-    indicators = {
-        ConfidenceLevel.HIGH: ("", "High confidence - course-specific data"),
-        ConfidenceLevel.MEDIUM: ("", "Medium confidence - limited course data"),
-        ConfidenceLevel.LOW: ("", "Low confidence - university average used")
-    }
-    return indicators[confidence_level]
+    return _INDICATORS[confidence_level]
 
 
-def get_projection_disclaimer(transparency: DataTransparency) -> str:
-    """Generate appropriate disclaimer based on data transparency"""
+def _format_projection_disclaimer(transparency: DataTransparency) -> str:
     if transparency.confidence_level == ConfidenceLevel.LOW:
         return (
             f" **Limited Course Data**: Only {transparency.years_of_data} year(s) of data available. "
@@ -92,23 +114,22 @@ def get_projection_disclaimer(transparency: DataTransparency) -> str:
     elif transparency.confidence_level == ConfidenceLevel.MEDIUM:
         return (
             f" **Limited Historical Data**: Based on {transparency.years_of_data} years of course data "
-            f"({min(transparency.actual_data_years)}-{max(transparency.actual_data_years)}). "
+            f"({transparency.first_year}-{transparency.last_year}). "
             f"Projections may have higher uncertainty."
         )
     else:
         return (
             f"**Reliable Projections**: Based on {transparency.years_of_data} years of course-specific data "
-            f"({min(transparency.actual_data_years)}-{max(transparency.actual_data_years)}). "
+            f"({transparency.first_year}-{transparency.last_year}). "
             f"Good confidence in projections."
         )
 
 
-def get_calculation_explanation(transparency: DataTransparency) -> str:
-    """Generate detailed explanation of how calculations are performed"""
+def _format_calculation_explanation(transparency: DataTransparency) -> str:
     explanation = f"""
     ** Calculation Methodology:**
 
-    **Data Source:** {transparency.years_of_data} years of historical fee data ({min(transparency.actual_data_years) if transparency.actual_data_years else 'N/A'}-{max(transparency.actual_data_years) if transparency.actual_data_years else 'N/A'})
+    **Data Source:** {transparency.years_of_data} years of historical fee data ({transparency.first_year or 'N/A'}-{transparency.last_year or 'N/A'})
 
     **Fee Growth Calculation:**
     """
@@ -144,15 +165,53 @@ def get_calculation_explanation(transparency: DataTransparency) -> str:
     return explanation
 
 
-def generate_parent_verification_guide(university: str, programme: str) -> str:
-    """Generate verification guide for parents"""
-    guides = {
-        'Oxford': f"""
+# Courses with no fee rows are always projected from the university average, so their
+# disclaimer is fixed and their explanation varies only with that average CAGR
+_NO_DATA_TRANSPARENCY = DataTransparency(
+    data_quality=assess_data_quality(0),
+    confidence_level=determine_confidence_level(assess_data_quality(0), True),
+    years_of_data=0,
+    actual_data_years=(),
+    latest_actual_year=2020,
+    is_using_university_average=True,
+    university_average_cagr=0.0,
+    course_specific_cagr=None,
+    calculation_method="University average CAGR",
+    source_verification="",
+)
+_NO_DATA_DISCLAIMER = _format_projection_disclaimer(_NO_DATA_TRANSPARENCY)
+
+
+@lru_cache(maxsize=32)
+def _no_data_explanation(university_average_cagr: float) -> str:
+    return _format_calculation_explanation(
+        replace(_NO_DATA_TRANSPARENCY, university_average_cagr=university_average_cagr)
+    )
+
+
+@lru_cache(maxsize=256)
+def get_projection_disclaimer(transparency: DataTransparency) -> str:
+    """Generate appropriate disclaimer based on data transparency"""
+    if not transparency.actual_data_years:
+        return _NO_DATA_DISCLAIMER
+    return _format_projection_disclaimer(transparency)
+
+
+@lru_cache(maxsize=256)
+def get_calculation_explanation(transparency: DataTransparency) -> str:
+    """Generate detailed explanation of how calculations are performed"""
+    if not transparency.actual_data_years:
+        return _no_data_explanation(transparency.university_average_cagr)
+    return _format_calculation_explanation(transparency)
+
+
+# Verification guide templates, formatted with university/programme placeholders
+_OXFORD_GUIDE = """
 ** How to Verify {university} {programme} Fees:**
 
 1. **Official Oxford Website:**
    - Visit: www.ox.ac.uk/admissions/undergraduate/fees-and-funding
-   - Search for: "overseas student fees {programme.lower()}"
+   - Search for: "overseas student fees {programme_lower}"
    - Check: Current academic year fee schedules
 
 2. **Direct Programme Pages:**
@@ -169,14 +228,14 @@ def generate_parent_verification_guide(university: str, programme: str) -> str:
 - "Overseas/International student" fee categories
 - Academic year format (e.g., "2025/26")
 - Any course-specific fee variations
-""",
+"""
 
-        'Cambridge': f"""
+_CAMBRIDGE_GUIDE = """
 ** How to Verify {university} {programme} Fees:**
 
 1. **Official Cambridge Website:**
    - Visit: www.undergraduate.study.cam.ac.uk/fees-and-costs
-   - Search for: "overseas fees {programme.lower()}"
+   - Search for: "overseas fees {programme_lower}"
    - Check: Current fee tables and projections
 
 2. **College-Specific Information:**
@@ -193,9 +252,9 @@ def generate_parent_verification_guide(university: str, programme: str) -> str:
 - "Overseas student" fee schedules
 - College fee supplements
 - Laboratory/practical fees for science courses
-""",
+"""
 
-        'LSE': f"""
+_LSE_GUIDE = """
 ** How to Verify {university} {programme} Fees:**
 
 1. **Official LSE Website:**
@@ -218,13 +277,12 @@ def generate_parent_verification_guide(university: str, programme: str) -> str:
 - Programme-specific pricing tiers
 - Additional costs for certain courses
 """
-    }
 
-    return guides.get(university, f"""
+_DEFAULT_GUIDE = """
 ** How to Verify {university} {programme} Fees:**
 
 1. **Official University Website:**
-   - Visit the official {university.lower()}.ac.uk website
+   - Visit the official {university_lower}.ac.uk website
    - Search for "international student fees" or "overseas fees"
    - Look for programme-specific fee information
 
@@ -237,4 +295,21 @@ def generate_parent_verification_guide(university: str, programme: str) -> str:
    - Confirm you're looking at "international/overseas" rates
    - Check the academic year format
    - Verify any course-specific variations
-""")
\ No newline at end of file
+"""
+
+
+_GUIDES = {
+    'Oxford': _OXFORD_GUIDE,
+    'Cambridge': _CAMBRIDGE_GUIDE,
+    'LSE': _LSE_GUIDE,
+}
+
+
+def generate_parent_verification_guide(university: str, programme: str) -> str:
+    """Generate verification guide for parents"""
+    return _GUIDES.get(university, _DEFAULT_GUIDE).format_map({
+        'university': university,
+        'programme': programme,
+        'programme_lower': programme.lower(),
+        'university_lower': university.lower(),
+    })
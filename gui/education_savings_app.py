@@ -3,8 +3,10 @@ import sys
 from pathlib import Path
 from streamlit_scroll_navigation import scroll_navbar
 
-# Import core modules
-sys.path.append(str(Path(__file__).parent))
+# Import core modules (added to sys.path once; this script re-executes on every rerun)
+_GUI_DIR = str(Path(__file__).resolve().parent)
+if _GUI_DIR not in sys.path:
+    sys.path.append(_GUI_DIR)
 from core.theme import configure_page
 from core.state import get_state
 from core.ui_components import (
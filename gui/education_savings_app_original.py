@@ -7,22 +7,21 @@ currency conversion strategies for UK university education.
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import plotly.io as pio
 import numpy as np
-from datetime import datetime
 import sys
 from pathlib import Path
 
-# Add current and parent directory to path for imports
-sys.path.append(str(Path(__file__).parent))
-sys.path.append(str(Path(__file__).parent.parent))
+# Make the repo root importable for the gui.* imports below. Streamlit re-executes this
+# script on every rerun, so only add it once instead of growing sys.path each time.
+_REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
 
 from gui.data_processor import EducationDataProcessor
 from gui.fee_calculator import EducationSavingsCalculator
 from gui.data_quality_utils import (
-    get_data_quality_badge, get_confidence_indicator,
     get_projection_disclaimer, get_calculation_explanation,
     DataQuality, ConfidenceLevel
 )
@@ -35,132 +34,184 @@ from gui.components.second_child import (
     SecondChildAdapter, render_second_child_sidebar,
     render_second_child_results
 )
+from gui.core.ui import format_inr, format_inr_vec, format_gbp, format_percentage
+from gui.core.chart_utils import split_historical_projected
+from gui.components.mobile_components import MobileMetric
+
+
+# Trace type for the projection line charts: WebGL by default, go.Scatter for SVG when debugging
+_SCATTER = go.Scattergl
+
+# Longer projection series are downsampled to this many points before plotting
+_MAX_CHART_POINTS = 500
+
+# Shared trace and layout styling for the projection and comparison charts
+# (flat trace-level kwargs, so every point shares one marker/line style)
+_FEE_HIST_STYLE = dict(line_color='#1f77b4', line_width=3, marker_size=8)
+_FEE_PROJ_STYLE = dict(line_color='#ff7f0e', line_width=3, line_dash='dash', marker_size=8)
+_FX_HIST_STYLE = dict(line_color='#2ca02c', line_width=3, marker_size=8)
+_FX_PROJ_STYLE = dict(line_color='#d62728', line_width=3, line_dash='dash', marker_size=8)
+_FEE_LAYOUT_BASE = dict(
+    xaxis_title="Year",
+    yaxis_title="Annual Fee (GBP)",
+    yaxis_tickformat='£,.0f',
+    height=400,
+    hovermode='x unified'
+)
+_FX_LAYOUT = dict(
+    title="GBP/INR Exchange Rate Projections<br>(Historical CAGR: 4.18% - Conservative)",
+    xaxis_title="Year",
+    yaxis_title="INR per GBP",
+    yaxis_tickformat='₹,.0f',
+    height=400,
+    hovermode='x unified'
+)
+_SAVINGS_LAYOUT = dict(
+    title="Total Cost Comparison (INR)",
+    xaxis_title="Strategy",
+    yaxis_title="Total Cost (INR)",
+    height=400
+)
+_BEST_COLOR, _OTHER_COLOR = '#2E8B57', '#4682B4'
+
+# Sidebar timeline options
+_CONVERSION_YEARS = (2023, 2024, 2025, 2026)
+_EDU_YEARS = tuple(range(2026, 2031))
+
+# Static body of the sidebar "Exchange Rate Verification" expander
+_FX_VERIFICATION_MD = (
+    "**Exchange Rate Verification:**\n\n"
+    "- Visit Bank of England website (www.bankofengland.co.uk)\n"
+    "- Search for 'Exchange rates' → Historical data\n"
+    "- Alternative: xe.com for current/historical rates"
+)
 
+# Data quality badge shown above the course metrics
+_BADGE_TMPL = "**Data Quality:** {quality} | **Confidence:** {confidence}"
 
 
-def format_inr(amount):
-    """Format INR amounts in lakhs/crores."""
-    if amount >= 10000000:  # 1 crore
-        return f"₹{amount/10000000:.2f} Cr"
-    elif amount >= 100000:  # 1 lakh
-        return f"₹{amount/100000:.2f} L"
-    else:
-        return f"₹{amount:,.0f}"
+def _downsample(xs, ys, max_pts=_MAX_CHART_POINTS):
+    """Largest-Triangle-Three-Buckets downsampling of a line series.
 
+    Series with at most max_pts points are returned unchanged. Otherwise the
+    first and last points are kept and one point is picked from each of
+    max_pts - 2 buckets: the one forming the largest triangle with the
+    previously kept point and the mean of the next bucket.
+    """
+    n = len(xs)
+    if n <= max_pts or max_pts < 3:
+        return xs, ys
 
-def format_gbp(amount):
-    """Format GBP amounts."""
-    return f"£{amount:,.0f}"
+    x = np.asarray(xs, dtype=float)
+    y = np.asarray(ys, dtype=float)
+    buckets = np.array_split(np.arange(1, n - 1), max_pts - 2)
+    buckets.append(np.array([n - 1]))
 
+    keep = np.empty(max_pts, dtype=np.intp)
+    keep[0] = prev = 0
+    for i, bucket in enumerate(buckets[:-1]):
+        following = buckets[i + 1]
+        next_x, next_y = x[following].mean(), y[following].mean()
+        area = np.abs((x[prev] - next_x) * (y[bucket] - y[prev]) - (x[prev] - x[bucket]) * (next_y - y[prev]))
+        prev = bucket[np.argmax(area)]
+        keep[i + 1] = prev
+    keep[-1] = n - 1
 
-def format_percentage(pct):
-    """Format percentage."""
-    return f"{pct:.1f}%"
+    return xs[keep], ys[keep]
 
 
 def create_fee_projection_chart(projections_data):
     """Create chart showing fee projections over time."""
     course_info = projections_data['course_info']
-    fee_projections = projections_data['fee_projections']
-
-    # Prepare data for chart
-    years = list(fee_projections.keys())
-    fees = list(fee_projections.values())
+    years = projections_data['fee_years']
+    fees = projections_data['fees']
 
     # Historical vs projected
-    historical_years = [y for y in years if y <= 2025]
-    projected_years = [y for y in years if y > 2025]
+    hist_years, hist_fees, proj_years, proj_fees = split_historical_projected(years, fees)
 
     fig = go.Figure()
 
     # Historical data
-    if historical_years:
-        historical_fees = [fee_projections[y] for y in historical_years]
-        fig.add_trace(go.Scatter(
-            x=historical_years,
-            y=historical_fees,
+    if hist_years.size:
+        hist_x, hist_y = _downsample(hist_years, hist_fees)
+        fig.add_trace(_SCATTER(
+            x=hist_x,
+            y=hist_y,
             mode='lines+markers',
             name='Historical',
-            line=dict(color='#1f77b4', width=3),
-            marker=dict(size=8)
+            **_FEE_HIST_STYLE
         ))
 
-    # Projected data
-    if projected_years:
-        # Connect last historical to first projected
-        connect_years = [historical_years[-1]] + projected_years if historical_years else projected_years
-        connect_fees = [fee_projections[y] for y in connect_years]
-
-        fig.add_trace(go.Scatter(
-            x=connect_years,
-            y=connect_fees,
+    # Projected data (connected to the last historical point)
+    if proj_years.size:
+        proj_x, proj_y = _downsample(proj_years, proj_fees)
+        fig.add_trace(_SCATTER(
+            x=proj_x,
+            y=proj_y,
             mode='lines+markers',
             name='Projected',
-            line=dict(color='#ff7f0e', width=3, dash='dash'),
-            marker=dict(size=8)
+            **_FEE_PROJ_STYLE
         ))
 
     fig.update_layout(
         title=f"{course_info['university']} - {course_info['programme']}<br>Fee Projections (CAGR: {course_info['cagr_pct']:.2f}%)",
-        xaxis_title="Year",
-        yaxis_title="Annual Fee (GBP)",
-        height=400,
-        hovermode='x unified'
+        **_FEE_LAYOUT_BASE
     )
 
-    fig.update_yaxes(tickformat='£,.0f')
-
     return fig
 
 
 def create_fx_projection_chart(projections_data):
     """Create chart showing exchange rate projections."""
-    fx_projections = projections_data['fx_projections']
-
-    years = list(fx_projections.keys())
-    rates = list(fx_projections.values())
+    years = projections_data['fx_years']
+    rates = projections_data['fx_rates']
 
     # Historical vs projected
-    historical_years = [y for y in years if y <= 2025]
-    projected_years = [y for y in years if y > 2025]
+    hist_years, hist_rates, proj_years, proj_rates = split_historical_projected(years, rates)
 
     fig = go.Figure()
 
     # Historical data
-    if historical_years:
-        historical_rates = [fx_projections[y] for y in historical_years]
-        fig.add_trace(go.Scatter(
-            x=historical_years,
-            y=historical_rates,
+    if hist_years.size:
+        hist_x, hist_y = _downsample(hist_years, hist_rates)
+        fig.add_trace(_SCATTER(
+            x=hist_x,
+            y=hist_y,
             mode='lines+markers',
             name='Historical',
-            line=dict(color='#2ca02c', width=3),
-            marker=dict(size=8)
+            **_FX_HIST_STYLE
         ))
 
-    # Projected data
-    if projected_years:
-        connect_years = [historical_years[-1]] + projected_years if historical_years else projected_years
-        connect_rates = [fx_projections[y] for y in connect_years]
-
-        fig.add_trace(go.Scatter(
-            x=connect_years,
-            y=connect_rates,
+    # Projected data (connected to the last historical point)
+    if proj_years.size:
+        proj_x, proj_y = _downsample(proj_years, proj_rates)
+        fig.add_trace(_SCATTER(
+            x=proj_x,
+            y=proj_y,
             mode='lines+markers',
             name='Projected',
-            line=dict(color='#d62728', width=3, dash='dash'),
-            marker=dict(size=8)
+            **_FX_PROJ_STYLE
         ))
 
-    fig.update_layout(
-        title="GBP/INR Exchange Rate Projections<br>(Historical CAGR: 4.18% - Conservative)",
-        xaxis_title="Year",
-        yaxis_title="INR per GBP",
-        height=400,
-        hovermode='x unified'
-    )
+    fig.update_layout(**_FX_LAYOUT)
 
-    fig.update_yaxes(tickformat='₹,.0f')
+    return fig
+
+
+def create_savings_comparison_chart(batch):
+    """Create bar chart comparing total cost across strategies from a ScenarioBatch."""
+    colors = np.full(len(batch), _OTHER_COLOR, dtype=object)
+    colors[:1] = _BEST_COLOR
+
+    fig = go.Figure(data=[go.Bar(
+        x=batch.names,
+        y=batch.cost_inr,
+        hovertext=format_inr_vec(batch.cost_inr),
+        hoverinfo='x+text',
+        marker_color=colors
+    )])
+
+    fig.update_layout(**_SAVINGS_LAYOUT)
 
     return fig
 
@@ -169,10 +220,161 @@ def create_fx_projection_chart(projections_data):
 # Mobile-optimized versions are used in main app
 
 
+@st.cache_resource
+def load_processors():
+    """Load data once per server and share the processor and calculator across reruns."""
+    processor = EducationDataProcessor()
+    processor.load_data()
+    return processor, EducationSavingsCalculator(processor)
+
+
+@st.cache_data(show_spinner=False)
+def cached_scenarios(university, course, conversion_year, education_year):
+    """Strategy comparison and its columnar batch, recomputed only when the inputs change."""
+    _, calculator = load_processors()
+    return calculator.compare_all_strategies_batch(university, course, conversion_year, education_year)
+
+
+@st.cache_data(show_spinner=False)
+def cached_roi_scenarios(university, course, conversion_year, education_year, investment_amount, strategies):
+    """ROI scenarios for the selected investment strategies, recomputed only when the inputs change."""
+    _, calculator = load_processors()
+    return calculator.calculate_all_roi_scenarios(
+        university, course, conversion_year, education_year, investment_amount, list(strategies)
+    )
+
+
+def course_context(university, course, education_year):
+    """Course info and projected annual fee at the education start year."""
+    data_processor, _ = load_processors()
+    return (
+        data_processor.get_course_info(university, course),
+        data_processor.project_fee(university, course, education_year)
+    )
+
 
+def transparency_notes(course_info):
+    """Sidebar "Data Sources & Terms" markdown and the projection disclaimer for a course.
 
+    Takes the course's get_course_info record, so the course is looked up only once.
+    Returns (explanation, verification guide, disclaimer), or None without transparency data.
+    """
+    transparency = course_info.get('transparency')
+    if not transparency:
+        return None
+    return (
+        get_calculation_explanation(transparency),
+        transparency.source_verification,
+        get_projection_disclaimer(transparency)
+    )
 
 
+def course_metrics(university, education_year, course_info, projected_annual_fee):
+    """The four course fee metrics for the analysis header, formatted once per selection."""
+    transparency = course_info.get('transparency')
+    latest_year = course_info.get('latest_actual_year', 'Unknown')
+    uses_university_average = course_info.get('is_using_university_average', False)
+    return [
+        MobileMetric(
+            f"3-Year Programme Total ({latest_year})",
+            format_gbp(course_info['latest_fee'] * 3),
+            help_text=f"Total cost for 3-year programme (UK fees fixed at enrollment from {latest_year})"
+        ),
+        MobileMetric(
+            f"Projected 3-Year Total ({education_year})",
+            format_gbp(projected_annual_fee * 3),
+            help_text=f"Total programme cost projected using {transparency.calculation_method if transparency else 'CAGR method'}"
+        ),
+        MobileMetric(
+            "University Avg CAGR" if uses_university_average else "Course CAGR",
+            format_percentage(course_info['cagr_pct']),
+            help_text=(f"Using {university} average due to limited course data" if uses_university_average
+                       else "Calculated from course-specific data")
+        ),
+        MobileMetric(
+            "Data Points",
+            f"{course_info['data_points']} years",
+            help_text=f"Historical data: {', '.join(map(str, transparency.actual_data_years)) if transparency else 'Unknown'}"
+        ),
+    ]
+
+
+def scenarios_table(university, course, conversion_year, education_year):
+    """Pre-formatted scenario summary for the sidebar, one row per strategy."""
+    _, batch = cached_scenarios(university, course, conversion_year, education_year)
+    return pd.DataFrame({
+        'Strategy': batch.names,
+        'Total': format_inr_vec(batch.cost_inr),
+        'Savings': format_inr_vec(np.maximum(batch.savings_inr, 0)),
+        '%': [format_percentage(pct) for pct in batch.savings_pct],
+        'FX': np.where(batch.fx > 0, np.char.mod("₹%.2f", batch.fx), "-"),
+    })
+
+
+@st.cache_data(show_spinner=False)
+def cached_projection_details(university, course, education_year):
+    """Fee and FX projections for the charts, recomputed only when their inputs change."""
+    _, calculator = load_processors()
+    return calculator.get_projection_details(university, course, education_year)
+
+
+def fx_forecast_table(conversion_year, education_year):
+    """Exchange rate forecast from conversion through the end of a 3-year programme."""
+    data_processor, _ = load_processors()
+    fx_years = np.arange(conversion_year, education_year + 3)
+    fx_rates = data_processor.project_fx_rate_vec(fx_years)
+    return pd.DataFrame({
+        'Year': fx_years,
+        'Rate (₹/£)': np.char.mod("₹%.2f", fx_rates),
+        'Status': np.where(fx_years <= 2025, "Historical", "Projected")
+    })
+
+
+@st.cache_data
+def fee_chart_json(university, course, education_year):
+    """Fee projection figure as JSON, rebuilt only when its inputs change."""
+    return create_fee_projection_chart(cached_projection_details(university, course, education_year)).to_json()
+
+
+@st.cache_data
+def fx_chart_json(university, course, education_year):
+    """FX projection figure as JSON, rebuilt only when its inputs change."""
+    return create_fx_projection_chart(cached_projection_details(university, course, education_year)).to_json()
+
+
+@st.cache_data
+def savings_chart_json(university, course, conversion_year, education_year):
+    """Strategy cost comparison figure as JSON, rebuilt only when its inputs change."""
+    _, batch = cached_scenarios(university, course, conversion_year, education_year)
+    return create_savings_comparison_chart(batch).to_json()
+
+
+
+
+
+
+
+
+@st.cache_data(show_spinner=False)
+def build_page_model(university, course, conversion_year, education_year):
+    """Everything the results page renders for one selection, behind a single cache lookup.
+
+    Returns a dict with the sorted scenarios, course info, projected annual
+    fee, transparency notes, course fee metrics, sidebar scenario table and
+    FX forecast table.
+    Chart figures are cached separately and kept in session state.
+    """
+    scenarios, _ = cached_scenarios(university, course, conversion_year, education_year)
+    course_info, projected_annual_fee = course_context(university, course, education_year)
+    return {
+        'scenarios': scenarios,
+        'course_info': course_info,
+        'projected_annual_fee': projected_annual_fee,
+        'notes': transparency_notes(course_info),
+        'course_metrics': course_metrics(university, education_year, course_info, projected_annual_fee),
+        'scenarios_table': scenarios_table(university, course, conversion_year, education_year),
+        'fx_table': fx_forecast_table(conversion_year, education_year),
+    }
 
 
 def main():
@@ -187,18 +389,9 @@ def main():
     st.title("UK Education Savings Calculator")
     st.markdown("**Calculate potential savings from early INR→GBP conversion strategies**")
 
-    # Initialize data processor
-    @st.cache_data
-    def load_data():
-        processor = EducationDataProcessor()
-        processor.load_data()
-        return processor
-
     try:
         with st.spinner("Loading education data..."):
-            data_processor = load_data()
-
-        calculator = EducationSavingsCalculator(data_processor)
+            data_processor, calculator = load_processors()
 
 
         # Sidebar for inputs
@@ -226,14 +419,14 @@ def main():
 
             conversion_year = st.sidebar.selectbox(
                 " Savings Start Year",
-                [2023, 2024, 2025, 2026],
+                _CONVERSION_YEARS,
                 index=0,
                 help="When to convert INR to GBP"
             )
 
             education_year = st.sidebar.selectbox(
                 " Education Start Year",
-                list(range(2026, 2031)),
+                _EDU_YEARS,
                 index=0,
                 help="When your child starts university"
             )
@@ -256,23 +449,24 @@ def main():
             st.session_state.selected_programme = selected_course
             second_child_config = render_second_child_sidebar(calculator, data_processor)
 
-            # Calculate scenarios first for sidebar display
-            scenarios = calculator.compare_all_strategies(
+            # Scenarios, course info and tables for this selection (one cached lookup)
+            model = build_page_model(
                 selected_university, selected_course, conversion_year, education_year
             )
+            scenarios = model['scenarios']
 
             # Calculate ROI scenarios if enabled
             roi_scenarios = []
             roi_error_message = None
             if roi_config.get("enabled", False):
                 try:
-                    roi_scenarios = calculator.calculate_all_roi_scenarios(
+                    roi_scenarios = cached_roi_scenarios(
                         selected_university,
                         selected_course,
                         conversion_year,
                         education_year,
                         roi_config["investment_amount"],
-                        roi_config["selected_strategies"]
+                        tuple(roi_config["selected_strategies"])
                     )
                 except Exception as e:
                     roi_error_message = str(e)
@@ -300,109 +494,51 @@ def main():
 
             # Sidebar scenarios
             st.sidebar.header("Saving Scenarios")
-            for i, scenario in enumerate(scenarios):
-                with st.sidebar.expander(f"{i+1}. {scenario.strategy_name}", expanded=(i==0)):
-                    st.metric("Total Cost", format_inr(scenario.total_cost_inr))
-
-                    if scenario.savings_vs_payg_inr > 0:
-                        st.metric(
-                            "Savings",
-                            format_inr(scenario.savings_vs_payg_inr),
-                            delta=format_percentage(scenario.savings_percentage)
-                        )
-                    else:
-                        st.info("Baseline comparison")
-
-                    if scenario.exchange_rate_used > 0:
-                        st.metric("Exchange Rate", f"₹{scenario.exchange_rate_used:.2f}/£")
-
-                    # Additional breakdown
-                    breakdown = scenario.breakdown
-                    if 'uk_earnings' in breakdown and breakdown['uk_earnings']['total_interest_gbp'] > 0:
-                        uk_earnings = breakdown['uk_earnings']
-                        st.caption(f"UK Interest: £{uk_earnings['total_interest_gbp']:.0f} ({uk_earnings['avg_interest_rate']*100:.1f}% avg BoE rate)")
+            st.sidebar.dataframe(
+                model['scenarios_table'],
+                hide_index=True,
+                use_container_width=True
+            )
 
             # Data Sources & Terms in Sidebar
             st.sidebar.header("Data Sources & Terms")
-            transparency = data_processor.get_course_info(selected_university, selected_course).get('transparency')
+            # Course info comes from the page model and is shared by the sidebar and the analysis section
+            course_info = model['course_info']
+            transparency = course_info.get('transparency')
+            notes = model['notes']
 
             if transparency:
+                explanation, verification_guide, disclaimer = notes
                 with st.sidebar.expander("How Numbers Are Calculated", expanded=False):
-                    explanation = get_calculation_explanation(transparency)
                     st.markdown(explanation)
 
                 with st.sidebar.expander("Parent Verification Guide", expanded=False):
-                    st.markdown(transparency.source_verification)
+                    st.markdown(verification_guide)
 
                 with st.sidebar.expander("Exchange Rate Verification", expanded=False):
-                    st.markdown("**Exchange Rate Verification:**")
-                    st.markdown("- Visit Bank of England website (www.bankofengland.co.uk)")
-                    st.markdown("- Search for 'Exchange rates' → Historical data")
-                    st.markdown("- Alternative: xe.com for current/historical rates")
+                    st.markdown(_FX_VERIFICATION_MD)
 
             # Main content area (full width)
             # Remove two-column layout for cleaner interface
             st.header(f"Analysis: {selected_university} - {selected_course}")
 
-            # Get course information
-            course_info = data_processor.get_course_info(selected_university, selected_course)
-
             # Display course metrics with transparency
             st.subheader("Course Fee Analysis")
 
-            # Get transparency info
-            transparency = course_info.get('transparency')
-
             # Data quality badge
             if transparency:
-                badge_emoji, badge_color = get_data_quality_badge(transparency.data_quality)
-                confidence_emoji, confidence_desc = get_confidence_indicator(transparency.confidence_level)
-
-                st.info(f"**Data Quality:** {transparency.data_quality.value.title()} | **Confidence:** {transparency.confidence_level.value.title()}")
-
-            # Create mobile-optimized metrics
-            latest_year = course_info.get('latest_actual_year', 'Unknown')
-            three_year_total = course_info['latest_fee'] * 3
-            projected_annual_fee = data_processor.project_fee(selected_university, selected_course, education_year)
-            projected_three_year_total = projected_annual_fee * 3
-            cagr_label = "Course CAGR" if not course_info.get('is_using_university_average', False) else "University Avg CAGR"
-            cagr_help = ("Calculated from course-specific data" if not course_info.get('is_using_university_average', False)
-                        else f"Using {selected_university} average due to limited course data")
-
-            # Display metrics using standard Streamlit columns
-            col1, col2, col3, col4 = st.columns(4)
-
-            with col1:
-                st.metric(
-                    f"3-Year Programme Total ({latest_year})",
-                    format_gbp(three_year_total),
-                    help=f"Total cost for 3-year programme (UK fees fixed at enrollment from {latest_year})"
-                )
+                st.info(_BADGE_TMPL.format(
+                    quality=transparency.quality_label,
+                    confidence=transparency.confidence_label
+                ))
 
-            with col2:
-                st.metric(
-                    f"Projected 3-Year Total ({education_year})",
-                    format_gbp(projected_three_year_total),
-                    help=f"Total programme cost projected using {transparency.calculation_method if transparency else 'CAGR method'}"
-                )
-
-            with col3:
-                st.metric(
-                    cagr_label,
-                    format_percentage(course_info['cagr_pct']),
-                    help=cagr_help
-                )
-
-            with col4:
-                st.metric(
-                    "Data Points",
-                    f"{course_info['data_points']} years",
-                    help=f"Historical data: {', '.join(map(str, transparency.actual_data_years)) if transparency else 'Unknown'}"
-                )
+            # Display metrics using standard Streamlit columns (formatted in the page model)
+            for col, metric in zip(st.columns(4), model['course_metrics']):
+                with col:
+                    st.metric(metric.label, metric.value, help=metric.help_text)
 
             # Add transparency disclaimer
             if transparency:
-                disclaimer = get_projection_disclaimer(transparency)
                 if transparency.confidence_level == ConfidenceLevel.LOW:
                     st.warning(disclaimer)
                 else:
@@ -417,61 +553,42 @@ def main():
                     f"({format_percentage(best_scenario.savings_percentage)})"
                 )
 
-            # Get projection details for charts
-            projections_data = calculator.get_projection_details(
-                selected_university, selected_course, education_year
-            )
-
-            # Charts section
+            # Charts section (figures are cached as JSON per input set, and the
+            # deserialized figures are kept in session state until the inputs change)
             st.subheader("Projections")
 
+            fig_key = (selected_university, selected_course, conversion_year, education_year)
+            if st.session_state.get('fig_key') != fig_key:
+                st.session_state.fee_fig = pio.from_json(
+                    fee_chart_json(selected_university, selected_course, education_year)
+                )
+                st.session_state.fx_fig = pio.from_json(
+                    fx_chart_json(selected_university, selected_course, education_year)
+                )
+                st.session_state.savings_fig = pio.from_json(savings_chart_json(
+                    selected_university, selected_course, conversion_year, education_year
+                )) if scenarios else None
+                st.session_state.fig_key = fig_key
+
             # Create charts using working repository's exact functions
             chart_col1, chart_col2 = st.columns(2)
             with chart_col1:
                 # Fee projection chart with historical/projected distinction
-                fee_chart = create_fee_projection_chart(projections_data)
-                st.plotly_chart(fee_chart, use_container_width=True)
+                st.plotly_chart(st.session_state.fee_fig, use_container_width=True)
 
             with chart_col2:
                 # FX projection chart with historical/projected distinction
-                fx_chart = create_fx_projection_chart(projections_data)
-                st.plotly_chart(fx_chart, use_container_width=True)
+                st.plotly_chart(st.session_state.fx_fig, use_container_width=True)
 
             # Strategy comparison
             st.subheader("Strategy Comparison")
-            if scenarios:
-                # Create simple bar chart
-                strategy_names = [scenario.strategy_name for scenario in scenarios]
-                total_costs = [scenario.total_cost_inr for scenario in scenarios]
-
-                savings_fig = go.Figure(data=[go.Bar(
-                    x=strategy_names,
-                    y=total_costs,
-                    marker_color=['#2E8B57' if i == 0 else '#4682B4' for i in range(len(scenarios))]
-                )])
-
-                savings_fig.update_layout(
-                    title="Total Cost Comparison (INR)",
-                    xaxis_title="Strategy",
-                    yaxis_title="Total Cost (INR)",
-                    height=400
-                )
-                st.plotly_chart(savings_fig, use_container_width=True)
+            if st.session_state.savings_fig is not None:
+                st.plotly_chart(st.session_state.savings_fig, use_container_width=True)
 
             # Exchange rate forecast
             st.subheader("Exchange Rate Forecast")
 
-            fx_data = []
-            for year in range(conversion_year, education_year + 3):
-                rate = data_processor.project_fx_rate(year)
-                status = "Historical" if year <= 2025 else "Projected"
-                fx_data.append({
-                    'Year': year,
-                    'Rate (₹/£)': f"₹{rate:.2f}",
-                    'Status': status
-                })
-
-            st.dataframe(pd.DataFrame(fx_data), use_container_width=True)
+            st.dataframe(model['fx_table'], use_container_width=True)
             st.caption("FX projections based on 8-year historical CAGR (4.18% annual depreciation, 2017-2025). Actual rates may vary due to economic conditions.")
 
             # ROI Analysis Section
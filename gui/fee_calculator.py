@@ -33,6 +33,32 @@ class SavingsScenario:
     breakdown: Dict
 
 
+@dataclass
+class ScenarioBatch:
+    """Column-wise view of a list of scenarios (one array per field, same order)."""
+    names: List[str]
+    cost_inr: np.ndarray
+    cost_gbp: np.ndarray
+    savings_inr: np.ndarray
+    savings_pct: np.ndarray
+    fx: np.ndarray
+
+    @classmethod
+    def from_scenarios(cls, scenarios: List[SavingsScenario]) -> "ScenarioBatch":
+        """Transpose scenarios into parallel arrays in a single pass."""
+        n = len(scenarios)
+        names = [None] * n
+        columns = np.empty((5, n))
+        for i, s in enumerate(scenarios):
+            names[i] = s.strategy_name
+            columns[:, i] = (s.total_cost_inr, s.total_cost_gbp, s.savings_vs_payg_inr,
+                             s.savings_percentage, s.exchange_rate_used)
+        return cls(names, *columns)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
 class EducationSavingsCalculator:
     """Core calculator for education savings strategies."""
 
@@ -65,10 +91,8 @@ class EducationSavingsCalculator:
 
         if years_invested > 0:
             # Calculate using actual BoE rates for each year
-            total_interest_rate = 0
-            for year in range(conversion_year, education_year):
-                year_rate = self.data_processor.get_uk_interest_rate(year)
-                total_interest_rate += year_rate
+            total_interest_rate = sum(map(self.data_processor.get_uk_interest_rate,
+                                          range(conversion_year, education_year)))
 
             avg_interest_rate = total_interest_rate / years_invested
             uk_earnings_gbp = total_gbp_needed * avg_interest_rate * years_invested
@@ -131,10 +155,16 @@ class EducationSavingsCalculator:
         total_inr_cost = 0
         conversion_details = {}
 
-        # Convert portion each year
-        for year_offset in range(years_to_education):
-            conversion_year_i = conversion_year + year_offset
-            fx_rate_i = self.data_processor.get_september_fx_rate(conversion_year_i)
+        # Convert portion each year: actual September rates up to the FX base year,
+        # then the projected trend for the remaining years in one vectorized call
+        conversion_years = np.arange(conversion_year, education_year)
+        projected = conversion_years > self.data_processor.FX_BASE_YEAR
+        fx_rates = np.empty(conversion_years.shape, dtype=np.float64)
+        fx_rates[~projected] = [
+            self.data_processor.get_september_fx_rate(year) for year in conversion_years[~projected].tolist()
+        ]
+        fx_rates[projected] = self.data_processor.project_fx_rate_vec(conversion_years[projected])
+        for conversion_year_i, fx_rate_i in zip(conversion_years.tolist(), fx_rates.tolist()):
             inr_cost_i = annual_gbp_amount * fx_rate_i
             total_inr_cost += inr_cost_i
 
@@ -251,6 +281,17 @@ class EducationSavingsCalculator:
 
         return scenarios
 
+    def compare_all_strategies_batch(
+        self,
+        university: str,
+        programme: str,
+        conversion_year: int,
+        education_year: int
+    ) -> Tuple[List[SavingsScenario], ScenarioBatch]:
+        """Compare all strategies, returning the scenarios and their columnar batch."""
+        scenarios = self.compare_all_strategies(university, programme, conversion_year, education_year)
+        return scenarios, ScenarioBatch.from_scenarios(scenarios)
+
     def get_projection_details(self, university: str, programme: str, education_year: int) -> Dict:
         """Get detailed projection information for charts."""
 
@@ -263,26 +304,25 @@ class EducationSavingsCalculator:
             fee_projections[year] = fee
 
         # Future projections
-        for year in range(2025, education_year + 4):
-            if year not in fee_projections:
-                projected_fee = self.data_processor.project_fee(university, programme, year)
-                fee_projections[year] = projected_fee
-
-        # FX projections
-        fx_projections = {}
-        for year in range(2020, education_year + 4):
-            if year <= 2025:
-                # Historical/current rates
-                fx_rate = self.data_processor.get_september_fx_rate(year)
-            else:
-                # Projected rates
-                fx_rate = self.data_processor.project_fx_rate(year)
-            fx_projections[year] = fx_rate
+        future_years = [year for year in range(2025, education_year + 4) if year not in fee_projections]
+        if future_years:
+            projected_fees = self.data_processor.project_fee_vec(university, programme, np.array(future_years))
+            fee_projections.update(zip(future_years, projected_fees.tolist()))
+
+        # FX projections: historical/current September rates up to 2025, projected after
+        fx_years = np.arange(2020, education_year + 4)
+        fx_rates = self.data_processor.project_fx_rate_vec(fx_years)
+        fx_projections = dict(zip(fx_years.tolist(), fx_rates.tolist()))
 
         return {
             'course_info': course_info,
             'fee_projections': fee_projections,
             'fx_projections': fx_projections,
+            # Same projections as arrays, in year order, for charting
+            'fee_years': np.fromiter(fee_projections.keys(), dtype=np.int64, count=len(fee_projections)),
+            'fees': np.fromiter(fee_projections.values(), dtype=np.float64, count=len(fee_projections)),
+            'fx_years': fx_years,
+            'fx_rates': fx_rates,
             'total_programme_cost': self.calculate_total_programme_cost(university, programme, education_year)
         }
 
@@ -24,8 +24,8 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.append(str(project_root))
 
 # Import existing backend modules (DO NOT MODIFY THESE)
-from gui.fee_calculator import EducationSavingsCalculator, SavingsScenario
-from gui.data_processor import EducationDataProcessor
+from gui.fee_calculator import SavingsScenario
+from gui.core.state import init_processors
 
 
 @dataclass
@@ -53,10 +53,8 @@ class InvestmentCalculator:
     def __init__(self):
         """Initialize calculator with backend components."""
         try:
-            # Initialize backend components
-            self.data_processor = EducationDataProcessor()
-            self.data_processor.load_data()
-            self.savings_calculator = EducationSavingsCalculator(self.data_processor)
+            # Shared backend components (loaded once per server via st.cache_resource)
+            self.data_processor, self.savings_calculator = init_processors()
 
             logger.info("Investment calculator initialized successfully")
         except Exception as e:
@@ -473,10 +471,14 @@ class InvestmentCalculator:
 
 
 # Convenience functions for common operations
+@st.cache_resource(show_spinner=False)
 def create_investment_calculator() -> InvestmentCalculator:
     """
     Create and initialize investment calculator.
 
+    The calculator (and the data it loads) is read-only, so one instance is
+    shared across reruns and sessions instead of reloading data per call.
+
     Returns:
         Initialized InvestmentCalculator instance
 
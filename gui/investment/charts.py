@@ -4,7 +4,6 @@ Placeholder for professional visualizations following Streamlit Design Bible
 """
 
 import plotly.graph_objects as go
-import plotly.express as px
 import pandas as pd
 import streamlit as st
 from typing import List, Dict, Any, Optional
@@ -5,6 +5,7 @@ Professional investment-focused components following Streamlit Design Bible
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import sys
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -151,12 +152,11 @@ def investment_options_section() -> Dict[str, Any]:
         if amount_strategy != "Custom Amount":
             # Try to fetch real tuition fee
             try:
-                # Import data processor to get real fees
+                # Shared data processor (loaded once per server via st.cache_resource)
                 sys.path.append(str(Path(__file__).parent.parent))
-                from gui.data_processor import EducationDataProcessor
+                from gui.core.state import init_processors
 
-                data_processor = EducationDataProcessor()
-                data_processor.load_data()
+                data_processor, _ = init_processors()
 
                 # Get latest tuition fee in GBP
                 annual_fee_gbp = data_processor.get_latest_fee(current_university, current_course)
@@ -374,26 +374,19 @@ def show_investment_projections(course_details: Dict, investment_details: Dict)
     # Show yearly breakdown
     st.markdown("#### Year-by-Year Growth")
 
-    # Create projection table
-    projection_data = []
-    current_amount = initial_amount
-
-    for year in range(years_to_goal + 1):
-        target_year = datetime.now().year + year
-        if year == 0:
-            growth = 0
-        else:
-            growth = current_amount * annual_return
-            current_amount += growth
-
-        projection_data.append({
-            "Year": target_year,
-            "Amount (₹)": int(current_amount),
-            "Annual Growth (₹)": int(growth),
-            "Return %": f"{annual_return*100:.1f}%" if year > 0 else "Initial"
-        })
-
-    df = pd.DataFrame(projection_data)
+    # Create projection table (compound growth for every year at once)
+    offsets = np.arange(years_to_goal + 1)
+    amounts = initial_amount * (1 + annual_return) ** offsets
+    growth = np.diff(amounts, prepend=amounts[0])
+    returns = np.full(offsets.size, f"{annual_return*100:.1f}%", dtype=object)
+    returns[0] = "Initial"
+
+    df = pd.DataFrame({
+        "Year": datetime.now().year + offsets,
+        "Amount (₹)": amounts.astype(np.int64),
+        "Annual Growth (₹)": growth.astype(np.int64),
+        "Return %": returns
+    })
 
     # Display with professional formatting
     st.dataframe(
@@ -4,7 +4,9 @@ Completely isolated from education_savings_app.py session state
 """
 
 import streamlit as st
+import numpy as np
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional, Dict, List, Any
 from datetime import datetime
 
@@ -162,24 +164,24 @@ def calculate_investment_projections() -> None:
     state.total_growth = state.final_amount - initial_amount
     state.total_return_percentage = ((state.final_amount - initial_amount) / initial_amount) * 100
 
-    # Generate year-by-year projections
-    projection_data = []
-    current_amount = initial_amount
-
-    for year in range(years_to_goal + 1):
-        target_year = current_year + year
-        if year == 0:
-            growth = 0
-        else:
-            growth = current_amount * annual_return
-            current_amount += growth
-
-        projection_data.append({
-            "year": target_year,
-            "amount": int(current_amount),
-            "annual_growth": int(growth),
-            "return_percentage": annual_return * 100 if year > 0 else 0
-        })
+    # Generate year-by-year projections: compound values for every year at once,
+    # growth as the year-on-year difference (zero in the starting year)
+    offsets = np.arange(years_to_goal + 1)
+    amounts = initial_amount * (1 + annual_return) ** offsets
+    growth = np.diff(amounts, prepend=amounts[0])
+    returns = np.where(offsets > 0, annual_return * 100, 0.0)
+
+    projection_data = [
+        {
+            "year": current_year + offset,
+            "amount": int(amount),
+            "annual_growth": int(annual_growth),
+            "return_percentage": return_pct
+        }
+        for offset, amount, annual_growth, return_pct in zip(
+            offsets.tolist(), amounts.tolist(), growth.tolist(), returns.tolist()
+        )
+    ]
 
     state.projection_data = projection_data
     state.projections_calculated = True
@@ -215,6 +217,7 @@ def get_strategy_comparison_data() -> Dict[str, Dict]:
     }
 
 
+@lru_cache(maxsize=2048)
 def format_investment_amount(amount: int) -> str:
     """
     Format investment amount in Indian currency notation
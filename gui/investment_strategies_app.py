@@ -23,9 +23,10 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any
 
-# Add paths for imports
-sys.path.append(str(Path(__file__).parent))
-sys.path.append(str(Path(__file__).parent.parent))
+# Add paths for imports (once; this script re-executes on every rerun)
+for _import_dir in (Path(__file__).resolve().parent, Path(__file__).resolve().parent.parent):
+    if str(_import_dir) not in sys.path:
+        sys.path.append(str(_import_dir))
 
 # Core imports
 from core.theme import configure_page
@@ -310,17 +311,15 @@ def section_results_and_charts():
         if state.projection_data:
             import pandas as pd
 
-            # Create DataFrame for display
-            df_data = []
-            for item in state.projection_data:
-                df_data.append({
-                    "Year": item['year'],
-                    "Investment Value": item['amount'],
-                    "Annual Growth": item['annual_growth'],
-                    "Return %": f"{item['return_percentage']:.1f}%" if item['return_percentage'] > 0 else "Initial"
-                })
-
-            df = pd.DataFrame(df_data)
+            # Create DataFrame for display, column-wise from the projection records
+            projections = pd.DataFrame(state.projection_data)
+            returns = projections['return_percentage']
+            df = pd.DataFrame({
+                "Year": projections['year'],
+                "Investment Value": projections['amount'],
+                "Annual Growth": projections['annual_growth'],
+                "Return %": returns.map("{:.1f}%".format).where(returns > 0, "Initial")
+            })
 
             st.dataframe(
                 df,
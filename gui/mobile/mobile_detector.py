@@ -9,6 +9,75 @@ from typing import Dict, Tuple, Optional
 import re
 
 
+# Detection scripts, built once at import instead of on every call
+_VIEWPORT_JS = """
+<script>
+function getViewportSize() {
+    const width = Math.max(document.documentElement.clientWidth || 0, window.innerWidth || 0);
+    const height = Math.max(document.documentElement.clientHeight || 0, window.innerHeight || 0);
+
+    // Store in session storage for Streamlit access
+    window.parent.postMessage({
+        type: 'viewport_size',
+        width: width,
+        height: height
+    }, '*');
+
+    return {width: width, height: height};
+}
+
+// Get initial size
+const size = getViewportSize();
+
+// Listen for resize events
+window.addEventListener('resize', getViewportSize);
+
+// Also check for orientation change on mobile
+window.addEventListener('orientationchange', function() {
+    setTimeout(getViewportSize, 100);
+});
+</script>
+"""
+
+_USER_AGENT_JS = """
+<script>
+const userAgent = navigator.userAgent;
+const isMobile = /Mobile|Android|iPhone|iPad|iPod|BlackBerry|Opera Mini|IEMobile|webOS|Windows Phone|Kindle|Silk|Mobile Safari/i.test(userAgent);
+const isTablet = /iPad|Android.*Tablet|Windows.*Touch/i.test(userAgent) && !/Mobile/i.test(userAgent);
+
+let deviceType = 'desktop';
+if (isMobile && !isTablet) {
+    deviceType = 'mobile';
+} else if (isTablet || isMobile) {
+    deviceType = 'tablet';
+}
+
+// Send to parent
+window.parent.postMessage({
+    type: 'user_agent_detection',
+    userAgent: userAgent,
+    deviceType: deviceType,
+    isMobile: isMobile,
+    isTablet: isTablet
+}, '*');
+</script>
+"""
+
+_VIEWPORT_LISTENER_JS = """
+<script>
+// Listen for messages from iframe
+window.addEventListener('message', function(event) {
+    if (event.data.type === 'viewport_size') {
+        // Update Streamlit session state (this requires custom component)
+        console.log('Viewport size:', event.data.width, 'x', event.data.height);
+    } else if (event.data.type === 'user_agent_detection') {
+        console.log('Device detection:', event.data.deviceType);
+    }
+});
+</script>
+"""
+
+
 class MobileDetector:
     """Detects device type and provides responsive configuration."""
 
@@ -28,37 +97,8 @@ class MobileDetector:
 
     def get_viewport_size(self) -> Tuple[int, int]:
         """Get viewport dimensions using JavaScript."""
-        viewport_js = """
-        <script>
-        function getViewportSize() {
-            const width = Math.max(document.documentElement.clientWidth || 0, window.innerWidth || 0);
-            const height = Math.max(document.documentElement.clientHeight || 0, window.innerHeight || 0);
-
-            // Store in session storage for Streamlit access
-            window.parent.postMessage({
-                type: 'viewport_size',
-                width: width,
-                height: height
-            }, '*');
-
-            return {width: width, height: height};
-        }
-
-        // Get initial size
-        const size = getViewportSize();
-
-        // Listen for resize events
-        window.addEventListener('resize', getViewportSize);
-
-        // Also check for orientation change on mobile
-        window.addEventListener('orientationchange', function() {
-            setTimeout(getViewportSize, 100);
-        });
-        </script>
-        """
-
         # Inject JavaScript
-        components.html(viewport_js, height=0)
+        components.html(_VIEWPORT_JS, height=0)
 
         # Get from session state or use defaults
         width = st.session_state.get('viewport_width', 1024)
@@ -72,31 +112,7 @@ class MobileDetector:
         try:
             # This is a workaround - Streamlit doesn't directly expose user agent
             # We'll use JavaScript to detect and store it
-            user_agent_js = """
-            <script>
-            const userAgent = navigator.userAgent;
-            const isMobile = /Mobile|Android|iPhone|iPad|iPod|BlackBerry|Opera Mini|IEMobile|webOS|Windows Phone|Kindle|Silk|Mobile Safari/i.test(userAgent);
-            const isTablet = /iPad|Android.*Tablet|Windows.*Touch/i.test(userAgent) && !/Mobile/i.test(userAgent);
-
-            let deviceType = 'desktop';
-            if (isMobile && !isTablet) {
-                deviceType = 'mobile';
-            } else if (isTablet || isMobile) {
-                deviceType = 'tablet';
-            }
-
-            // Send to parent
-            window.parent.postMessage({
-                type: 'user_agent_detection',
-                userAgent: userAgent,
-                deviceType: deviceType,
-                isMobile: isMobile,
-                isTablet: isTablet
-            }, '*');
-            </script>
-            """
-
-            components.html(user_agent_js, height=0)
+            components.html(_USER_AGENT_JS, height=0)
 
             # Return stored value or default
             return st.session_state.get('detected_device_type', 'desktop')
@@ -109,6 +125,11 @@ class MobileDetector:
         Determine device type based on viewport and user agent.
         Returns: 'mobile', 'tablet', or 'desktop'
         """
+        # Device type does not change within a session; detect once and reuse
+        cached = st.session_state.get('device_type')
+        if cached is not None:
+            return cached
+
         # Get viewport dimensions
         width, height = self.get_viewport_size()
 
@@ -149,7 +170,9 @@ class MobileDetector:
     def get_device_info(self) -> Dict:
         """Get comprehensive device information."""
         device_type = self.get_device_type()
-        width, height = self.get_viewport_size()
+        # Dimensions recorded alongside the device type, without re-running detection
+        width = st.session_state.get('viewport_width', 1024)
+        height = st.session_state.get('viewport_height', 768)
 
         return {
             'device_type': device_type,
@@ -165,28 +188,7 @@ class MobileDetector:
     @staticmethod
     def setup_viewport_listener():
         """Setup JavaScript listener for viewport changes."""
-        listener_js = """
-        <script>
-        // Listen for messages from iframe
-        window.addEventListener('message', function(event) {
-            if (event.data.type === 'viewport_size') {
-                // Update Streamlit session state (this requires custom component)
-                console.log('Viewport size:', event.data.width, 'x', event.data.height);
-            } else if (event.data.type === 'user_agent_detection') {
-                console.log('Device detection:', event.data.deviceType);
-            }
-        });
-
-        // Force detection on load
-        setTimeout(function() {
-            const width = Math.max(document.documentElement.clientWidth || 0, window.innerWidth || 0);
-            const height = Math.max(document.documentElement.clientHeight || 0, window.innerHeight || 0);
-            console.log('Initial viewport:', width, 'x', height);
-        }, 100);
-        </script>
-        """
-
-        components.html(listener_js, height=0)
+        components.html(_VIEWPORT_LISTENER_JS, height=0)
 
 
 # Global detector instance
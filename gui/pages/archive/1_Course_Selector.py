@@ -93,7 +93,7 @@ try:
             # Data quality information
             transparency = course_info.get('transparency')
             if transparency:
-                st.info(f"**Data Quality:** {transparency.data_quality.value.title()} | **Confidence:** {transparency.confidence_level.value.title()}")
+                st.info(f"**Data Quality:** {transparency.quality_label} | **Confidence:** {transparency.confidence_label}")
 
             # Update state
             update_state(university=university, course=course)
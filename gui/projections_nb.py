@@ -0,0 +1,53 @@
+"""
+Numba kernels for bulk fee and exchange rate projections.
+
+Used when many (course, year) projections are needed at once, e.g. the
+comparison screens and chart series, so the compounding loop runs as
+native code.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    # Define a no-op decorator if numba is not available
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True)
+def project_many(base_fees, cagrs, base_years, target_years):
+    """Project each base fee forward by its CAGR to its target year.
+
+    Target years at or before the base year return the base fee unchanged,
+    matching EducationDataProcessor.project_fee.
+    """
+    out = np.empty_like(base_fees)
+    for i in range(base_fees.size):
+        years_ahead = target_years[i] - base_years[i]
+        if years_ahead <= 0:
+            out[i] = base_fees[i]
+        else:
+            out[i] = base_fees[i] * (1.0 + cagrs[i]) ** years_ahead
+    return out
+
+
+@njit(cache=True)
+def compound_series(base_value, rate, base_year, target_years):
+    """Compound one base value by a fixed annual rate to each target year.
+
+    Target years at or before the base year return the base value unchanged.
+    """
+    out = np.empty(target_years.size, dtype=np.float64)
+    for i in range(target_years.size):
+        years_ahead = target_years[i] - base_year
+        if years_ahead <= 0:
+            out[i] = base_value
+        else:
+            out[i] = base_value * (1.0 + rate) ** years_ahead
+    return out
@@ -6,9 +6,9 @@ UI components for investment analysis interface.
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 from typing import List, Dict, Optional
+from functools import lru_cache
 import numpy as np
 
 
@@ -137,6 +137,48 @@ def render_roi_sidebar(conversion_year: int, education_year: int, university: st
     }
 
 
+@lru_cache(maxsize=256)
+def _roi_summary_row(strategy_name: str, final_value: float, investment_amount: float,
+                     investment_period: str) -> Dict:
+    """Pre-formatted comparison row for one ROI scenario (treat as read-only)."""
+    profit = final_value - investment_amount
+    roi_pct = (profit / investment_amount * 100) if investment_amount > 0 else 0
+
+    # Calculate investment period and yearly rate
+    try:
+        years = int(investment_period.split(' → ')[1]) - int(investment_period.split(' → ')[0])
+    except:
+        years = 3  # Default fallback
+
+    yearly_rate = ((final_value / investment_amount) ** (1/years) - 1) * 100 if years > 0 and investment_amount > 0 else 0
+
+    # Extract strategy name
+    base_name = strategy_name.split(' (')[0].replace('Investment', '').strip()
+    if 'GOLD' in base_name.upper():
+        display_name = " Gold"
+        risk_level = "Medium Risk"
+        note = "Based on recent market performance - can vary significantly"
+    elif 'FIXED' in base_name.upper() or '5%' in base_name:
+        display_name = " Fixed Deposit"
+        risk_level = "No Risk"
+        note = "Guaranteed return, principal protected"
+    else:
+        display_name = base_name
+        risk_level = "Unknown"
+        note = ""
+
+    return {
+        'Strategy': display_name,
+        'Final Value': f"₹{final_value/100000:.1f}L",
+        'Your Profit': f"₹{profit/100000:.1f}L",
+        'Total Return': f"{roi_pct:.0f}%",
+        'Yearly %': f"{yearly_rate:.1f}%",
+        'Years': f"{years}",
+        'Risk Level': risk_level,
+        'Important Note': note
+    }
+
+
 def render_roi_scenarios_summary(scenarios: List, investment_amount: float):
     """Render summary of ROI scenarios.
 
@@ -153,51 +195,17 @@ def render_roi_scenarios_summary(scenarios: List, investment_amount: float):
     # Clear comparison table for Indian parents
     st.markdown("**Your Investment:** ₹{:,.0f} ({:.1f} Lakh)".format(investment_amount, investment_amount/100000))
 
-    # Create simple comparison
-    comparison_data = []
-
-    for scenario in scenarios:
-        final_value = scenario.conversion_details.get('final_pot_inr', 0)
-        profit = final_value - investment_amount
-        roi_pct = (profit / investment_amount * 100) if investment_amount > 0 else 0
-
-        # Calculate investment period and yearly rate
-        investment_period = scenario.conversion_details.get('investment_period', '2024 → 2027')
-        try:
-            years = int(investment_period.split(' → ')[1]) - int(investment_period.split(' → ')[0])
-        except:
-            years = 3  # Default fallback
-
-        yearly_rate = ((final_value / investment_amount) ** (1/years) - 1) * 100 if years > 0 and investment_amount > 0 else 0
-
-        # Extract strategy name
-        strategy_name = scenario.strategy_name.split(' (')[0].replace('Investment', '').strip()
-        if 'GOLD' in strategy_name.upper():
-            display_name = " Gold"
-            risk_level = "Medium Risk"
-            note = "Based on recent market performance - can vary significantly"
-        elif 'FIXED' in strategy_name.upper() or '5%' in strategy_name:
-            display_name = " Fixed Deposit"
-            risk_level = "No Risk"
-            note = "Guaranteed return, principal protected"
-        else:
-            display_name = strategy_name
-            risk_level = "Unknown"
-            note = ""
-
-        comparison_data.append({
-            'Strategy': display_name,
-            'Final Value': f"₹{final_value/100000:.1f}L",
-            'Your Profit': f"₹{profit/100000:.1f}L",
-            'Total Return': f"{roi_pct:.0f}%",
-            'Yearly %': f"{yearly_rate:.1f}%",
-            'Years': f"{years}",
-            'Risk Level': risk_level,
-            'Important Note': note
-        })
-
-    # Sort by final value (best first)
-    comparison_data.sort(key=lambda x: float(x['Final Value'].replace('₹', '').replace('L', '')), reverse=True)
+    # Best option first; rows are formatted once per distinct scenario
+    ordered = sorted(scenarios, key=lambda x: x.conversion_details.get('final_pot_inr', 0), reverse=True)
+    comparison_data = [
+        _roi_summary_row(
+            scenario.strategy_name,
+            scenario.conversion_details.get('final_pot_inr', 0),
+            investment_amount,
+            scenario.conversion_details.get('investment_period', '2024 → 2027')
+        )
+        for scenario in ordered
+    ]
 
     # Display as clean table
     for i, data in enumerate(comparison_data):
@@ -420,6 +428,7 @@ def render_risk_tolerance_guide(risk_tolerance: str) -> Dict:
     return profile
 
 
+@lru_cache(maxsize=2048)
 def format_roi_metrics(amount: float, is_currency: bool = True) -> str:
     """Format ROI metrics for display.
 